@@ -1,19 +1,63 @@
 # gui_manager.py
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import ttkbootstrap as tb
-from ttkbootstrap.constants import SUCCESS, DANGER, INFO, PRIMARY
-import yaml
-import aiohttp
+from tkinter import font as tkfont
 import asyncio
 import threading
-import xml.etree.ElementTree as ET
+import time
 import json
+import copy
+import hashlib
+import marshal
+import mmap
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Callable, Any, Tuple, TypedDict
 import logging
 from preach_info_db import PreachInfoDB
 
+if TYPE_CHECKING:
+    import aiohttp
+
+# ttkbootstrap, yaml and aiohttp are imported on first use (GUI start, config I/O,
+# first discovery) so importing this module stays cheap for headless callers.
+_YAML: Optional[Tuple[Any, Any, Any]] = None
+
+
+def _yaml() -> Tuple[Any, Any, Any]:
+    """Return (yaml, Loader, Dumper), preferring the libyaml-backed classes."""
+    global _YAML
+    if _YAML is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as loader, CSafeDumper as dumper
+        except ImportError:
+            from yaml import SafeLoader as loader, SafeDumper as dumper
+        _YAML = (yaml, loader, dumper)
+    return _YAML
+
+try:
+    import orjson  # optional C JSON codec
+    _ORJSON_OK = True
+except ImportError:
+    _ORJSON_OK = False
+
+try:
+    import ijson  # optional streaming JSON parser for very large imports
+    _IJSON_OK = True
+except ImportError:
+    _IJSON_OK = False
+
+try:
+    from lxml import etree as ET  # libxml2-backed parser
+    _LXML_OK = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _LXML_OK = False
+
 # -----------------------
 # Logging
 # -----------------------
@@ -24,54 +68,174 @@ logging.basicConfig(
 logger = logging.getLogger("LyriSyncGUI")
 
 CONFIG_FILE = "lyrisync_config.yaml"
+SAVE_DEBOUNCE_MS = 250
+
+# bootstyle names (same values as ttkbootstrap.constants)
+SUCCESS, DANGER, INFO, PRIMARY = "success", "danger", "info", "primary"
+
+THEMES = ("darkly", "flatly", "cosmo", "pulse", "cyborg", "sandstone", "superhero", "morph", "journal", "simplex")
+LED_ON = "#2ca34a"
+LED_OFF = "#c43c3c"
+# UI pump interval: fast while callbacks are arriving, backing off when idle
+UI_PUMP_MIN_MS = 1
+UI_PUMP_MAX_MS = 50
+# fixed tick while asyncio tasks (discovery, Test vMix) are pending: I/O readiness
+# doesn't need 1 ms polling, and Tk timers are ~15 ms on Windows anyway
+UI_PUMP_ASYNC_MS = 15
+DISCOVERY_CACHE_TTL_SEC = 8.0
+DISCOVERY_MAX_BYTES = 5 * 1024 * 1024   # anything bigger is not a sane vMix /api reply
+# imports at least this big are streamed with ijson (when installed) instead of parsed whole
+STREAM_IMPORT_MIN_BYTES = 8 * 1024 * 1024
+DISCOVERY_CONCURRENCY = 16              # matches the discoverer's connector limit
+
+# Role editor parsing: "0, 1, 2" deck IDs and "key:action, ..." button maps
+_DECK_ID_RE = re.compile(r"(?:^|,)\s*(\d+)\s*(?=,|$)")
+_BUTTON_MAP_RE = re.compile(r"\s*([^,:]*?)\s*:\s*([^,]*?)\s*(?:,|$)")
+# vMix API URLs must be plain http(s)
+_URL_RE = re.compile(r"^https?://", re.ASCII)
+
+# Compiled once, evaluated per <input> during discovery (lxml only)
+_DATA_TEXT_NAMES_XPATH = ET.XPath("data/text/@name", smart_strings=False) if _LXML_OK else None
+
+# ((path, blake2b digest of the YAML bytes), merged_config) from the last successful load
+_CONFIG_CACHE: Optional[Tuple[Tuple[str, bytes], Dict[str, Any]]] = None
+# blake2b digest of the bytes last written by save_config
+_last_hash: Optional[bytes] = None
 
 
 # =======================
 # Config helpers
 # =======================
-def _default_config() -> Dict[str, Any]:
-    return {
-        "roles": [],
-        "ui": {"theme": "darkly"},
-        "settings": {
-            # legacy single-connection fields are still supported/used by main.py
-            "vmix_api_url": "http://localhost:8088/api",
-            "openlp_ws_url": "ws://localhost:4317",
-            "api_port": 5000,
-            "vmix_title_input": "SongTitle",
-            "vmix_title_field": "Message.Text",
-
-            "splash_enabled": True,
-            "poll_interval_sec": 2,
-            "overlay_channel": 1,
-            "auto_overlay_on_send": True,
-            "auto_overlay_out_on_clear": True,
-            "overlay_always_on": False,
-            "auto_clear_idle_sec": 0,
-            "max_chars_per_line": 36,        # conservative default wrap
-            "clear_on_blank": True,
-            "text_layer_above": False,       # optional vMix title layer behavior
-
-            # NEW: multi-connection list (each connection has openlp/vmix + mappings)
-            "connections": [],
-            "preach_db_path": "lyrisync_preach.db",
-        }
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Any] = {
+    "roles": [],
+    "ui": {"theme": "darkly"},
+    "settings": {
+        # legacy single-connection fields are still supported/used by main.py
+        "vmix_api_url": "http://localhost:8088/api",
+        "openlp_ws_url": "ws://localhost:4317",
+        "api_port": 5000,
+        "vmix_title_input": "SongTitle",
+        "vmix_title_field": "Message.Text",
+
+        "splash_enabled": True,
+        "poll_interval_sec": 2,
+        "show_debounce_ms": 50,          # collapse slide bursts into one vMix update
+        "overlay_channel": 1,
+        "auto_overlay_on_send": True,
+        "auto_overlay_out_on_clear": True,
+        "overlay_always_on": False,
+        "auto_clear_idle_sec": 0,
+        "max_chars_per_line": 36,        # conservative default wrap
+        "clear_on_blank": True,
+        "text_layer_above": False,       # optional vMix title layer behavior
+
+        # NEW: multi-connection list (each connection has openlp/vmix + mappings)
+        "connections": [],
+        "preach_db_path": "lyrisync_preach.db",
     }
+}
+
+
+class ConnectionConfig(TypedDict):
+    """One entry of settings["connections"], as stored after _normalize_connection."""
+    name: str
+    openlp_ip: str
+    http_port: int
+    ws_port: int
+    vmix_api_url: str
+    mappings: List[Dict[str, str]]
+
+
+_CONNECTION_DEFAULTS: Dict[str, Any] = {
+    "name": "Connection",
+    "openlp_ip": "127.0.0.1",
+    "http_port": 4316,
+    "ws_port": 4317,
+    "vmix_api_url": "",
+}
+
+
+def _normalize_connection(c: Any) -> ConnectionConfig:
+    """Fill in defaults once so readers can index connection keys directly."""
+    if not isinstance(c, dict):
+        raise ValueError(f"Connection entries must be objects, got {type(c).__name__}")
+    maps = c.get("mappings")
+    if (
+        _CONNECTION_DEFAULTS.keys() <= c.keys()
+        and isinstance(maps, list)
+        and all(isinstance(m, dict) and "input" in m and "field" in m for m in maps)
+    ):
+        return c  # fast path: already complete
+    out = {**_CONNECTION_DEFAULTS, **c}
+    out["mappings"] = [{"input": "", "field": "", **m} for m in maps or () if isinstance(m, dict)]
+    return out
+
+
+def _default_config() -> Dict[str, Any]:
+    return copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+
+
+def _read_config_snapshot(digest: bytes) -> Optional[Dict[str, Any]]:
+    """Parsed config from the marshal snapshot, if it was taken of these exact YAML bytes."""
+    try:
+        with open(CONFIG_FILE + ".cache", "rb") as f:
+            tag, data = marshal.load(f)
+    except Exception:
+        return None
+    return data if tag == (marshal.version, digest) else None
+
+
+def _write_config_snapshot(digest: bytes, data: Dict[str, Any]):
+    # marshal: fastest stdlib codec for plain YAML-safe data. It is NOT safe
+    # against crafted input; that's acceptable only because this is a local
+    # file we write ourselves and it is just a speed cache (the YAML is the truth)
+    tmp = CONFIG_FILE + ".cache.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            marshal.dump(((marshal.version, digest), data), f)
+        os.replace(tmp, CONFIG_FILE + ".cache")
+    except Exception as e:
+        logger.debug("Config snapshot not written: %s", e)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
 
 
 def load_config() -> Dict[str, Any]:
+    global _CONFIG_CACHE
     path = Path(CONFIG_FILE)
     if not path.exists():
         return _default_config()
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        raw = path.read_bytes()
+        # keyed on content, not mtime/size: coarse-mtime filesystems (FAT, 2 s)
+        # can hide a same-length edit; hashing a small YAML file is cheap
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        key = (str(path), digest)
+        if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == key:
+            return copy.deepcopy(_CONFIG_CACHE[1])
+        data = _read_config_snapshot(digest)
+        if data is None:
+            yaml, loader, _ = _yaml()
+            data = yaml.load(raw, Loader=loader) or {}
+            _write_config_snapshot(digest, data)
         base = _default_config()
+        ui, settings = base["ui"], base["settings"]
         base.update(data)
-        base["ui"] = {**_default_config()["ui"], **(data.get("ui") or {})}
-        base["settings"] = {**_default_config()["settings"], **(data.get("settings") or {})}
+        ui.update(data.get("ui") or {})
+        settings.update(data.get("settings") or {})
+        base["ui"], base["settings"] = ui, settings
         base["roles"] = data.get("roles") or []
-        return base
+        conns = []
+        for c in settings.get("connections") or []:
+            try:
+                conns.append(_normalize_connection(c))
+            except ValueError as e:
+                logger.warning("Dropping invalid connection in config: %s", e)
+        settings["connections"] = conns
+        _CONFIG_CACHE = (key, base)
+        return copy.deepcopy(base)
     except Exception as e:
         logger.error("Failed to load config: %s", e)
         messagebox.showerror("Config Error", f"Failed to load configuration:\n{e}\nUsing defaults.")
@@ -79,76 +243,256 @@ def load_config() -> Dict[str, Any]:
 
 
 def save_config(config: Dict[str, Any]) -> bool:
+    global _CONFIG_CACHE, _last_hash
+    tmp = CONFIG_FILE + ".tmp"
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            yaml.safe_dump(config, f, default_flow_style=False, allow_unicode=True)
+        yaml, _, dumper = _yaml()
+        payload = yaml.dump(config, Dumper=dumper, default_flow_style=False,
+                            allow_unicode=True).encode("utf-8")
+        h = hashlib.blake2b(payload, digest_size=16).digest()
+        if h == _last_hash and os.path.exists(CONFIG_FILE):
+            return True  # identical to what is already on disk
+        _CONFIG_CACHE = None
+        # write-then-rename so a crash never leaves a torn YAML file
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, CONFIG_FILE)
+        _last_hash = h
+        _write_config_snapshot(h, config)
         return True
     except Exception as e:
+        # may run on the GUI's save worker thread: log only, callers surface the failure
         logger.error("Failed to save config: %s", e)
-        messagebox.showerror("Config Error", f"Failed to save configuration:\n{e}")
         return False
 
 
+# =======================
+# Connections JSON import/export
+# =======================
+def _stream_connections_json(f) -> Any:
+    """ijson parse yielding the same shapes read_connections_json expects, without the raw text in memory."""
+    first = b""
+    while not first:
+        ch = f.read(1)
+        if not ch:
+            raise ValueError("JSON file is empty")
+        if not ch.isspace():
+            first = ch
+    f.seek(0)
+    if first == b"[":
+        return list(ijson.items(f, "item", use_float=True))
+    conns = next(ijson.items(f, "connections", use_float=True), None)
+    return {} if conns is None else {"connections": conns}
+
+
+def read_connections_json(path: str) -> List[Dict[str, Any]]:
+    """Read a list of connections (or {"connections": [...]}) from a JSON file."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if _IJSON_OK and size >= STREAM_IMPORT_MIN_BYTES:
+            data = _stream_connections_json(f)
+        elif _ORJSON_OK and size:
+            # orjson parses straight from the mapped pages: no bytes copy of the file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                data = orjson.loads(view)
+        else:
+            data = json.loads(f.read())
+    if isinstance(data, dict) and "connections" in data:
+        conns = data["connections"]
+    else:
+        conns = data
+    if not isinstance(conns, list):
+        raise ValueError('JSON must be a list of connection objects or {"connections": [...]}')
+    return [_normalize_connection(c) for c in conns]
+
+
+def write_connections_json(path: str, connections: List[Dict[str, Any]]) -> None:
+    payload = {"connections": connections}
+    if _ORJSON_OK:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 # =======================
 # Async vMix discovery
 # =======================
-class AsyncVmixDiscoverer:
+class _VmixInputCollector:
+    """
+    Incremental vMix XML reader: extracts input names and title fields as
+    chunks arrive, dropping each <input> once read so the tree never grows.
+    """
+    __slots__ = ("_parser", "_stack", "_head", "_size", "fields_by_input")
+
+    _HEAD_BYTES = 256
+
     def __init__(self):
-        self._session: Optional[aiohttp.ClientSession] = None
-        self._lock = threading.Lock()
+        if _LXML_OK:
+            # lxml filters in C: only </input> events reach Python
+            self._parser = ET.XMLPullParser(events=("end",), tag="input")
+        else:
+            self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack: List[Any] = []
+        # leading bytes held back until we've confirmed this is vMix XML
+        self._head: Optional[bytearray] = bytearray()
+        self._size = 0
+        # insertion-ordered: its keys double as the de-duplicated input name list
+        self.fields_by_input: Dict[str, List[str]] = {}
+
+    def feed(self, chunk: bytes):
+        self._size += len(chunk)
+        if self._size > DISCOVERY_MAX_BYTES:
+            raise ValueError(f"Response larger than {DISCOVERY_MAX_BYTES // (1024 * 1024)} MB; not a vMix API reply")
+        if self._head is not None:
+            self._head += chunk
+            if len(self._head) < self._HEAD_BYTES:
+                return
+            chunk = self._release_head()
+        self._parser.feed(chunk)
+        self._drain()
+
+    def close(self) -> Tuple[List[str], Dict[str, List[str]]]:
+        if self._head is not None:
+            self._parser.feed(self._release_head())
+        self._parser.close()
+        self._drain()
+        return list(self.fields_by_input), self.fields_by_input
+
+    def _release_head(self) -> bytes:
+        data, self._head = bytes(self._head), None
+        head = data.lstrip(b"\xef\xbb\xbf \t\r\n")
+        if head.startswith(b"<?xml"):
+            end = head.find(b"?>")
+            head = head[end + 2:].lstrip() if end != -1 else b""
+        if not head.startswith(b"<vmix"):
+            raise ValueError(f"Endpoint did not return vMix XML (got: {data[:32]!r}...)")
+        return data
+
+    def _drain(self):
+        if _LXML_OK:
+            for _, elem in self._parser.read_events():
+                parent = elem.getparent()
+                if parent is not None and parent.tag == "inputs":
+                    self._consume(elem)
+                    elem.clear()
+                    # fast-iter: drop this and any earlier siblings
+                    while elem.getprevious() is not None:
+                        del parent[0]
+                    parent.remove(elem)
+            return
+        # stdlib ElementTree has no parent pointers: track them with a stack
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._stack.append(elem)
+                continue
+            self._stack.pop()
+            parent = self._stack[-1] if self._stack else None
+            if elem.tag == "input" and parent is not None and parent.tag == "inputs":
+                self._consume(elem)
+                elem.clear()
+                parent.remove(elem)
+
+    def _consume(self, node):
+        attrib = node.attrib
+        name = attrib.get("title") or attrib.get("shortTitle") or attrib.get("number") or "Unknown"
+        if _DATA_TEXT_NAMES_XPATH is not None:
+            names = _DATA_TEXT_NAMES_XPATH(node)
+        else:
+            names = [t.attrib.get("name") for t in node.iterfind("data/text")]
+        # ordered de-dupe, dropping empty names
+        self.fields_by_input[name] = [nm for nm in dict.fromkeys(names) if nm]
+
+
+class AsyncVmixDiscoverer:
+    """
+    vMix input/field discovery. Holds one pooled ClientSession for the
+    process lifetime; only ever used from the GUI's asyncio loop.
+    """
+    __slots__ = ("_session", "_cache", "ttl", "loop")
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None, ttl: float = DISCOVERY_CACHE_TTL_SEC):
+        # the loop discovery coroutines are scheduled on (stepped from the Tk thread)
+        self.loop = loop
+        self.ttl = ttl
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # api_url -> (fetched_at, etag, input_names, fields_by_input)
+        self._cache: Dict[str, Tuple[float, Optional[str], List[str], Dict[str, List[str]]]] = {}
+
+    @property
+    def session(self) -> Optional["aiohttp.ClientSession"]:
+        return self._session
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=16, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=60)
+            # vMix serves plain XML on a LAN: no compression negotiation or UA needed
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=5),
+                skip_auto_headers=("User-Agent", "Accept-Encoding"),
+                auto_decompress=False,
+                read_bufsize=65536,
+            )
+        return self._session
+
+    def invalidate(self, api_url: Optional[str] = None):
+        """Forget cached discovery results for one URL (or all of them)."""
+        if api_url is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(api_url, None)
+
+    async def discover_many(self, api_urls: List[str], limit: int = DISCOVERY_CONCURRENCY) -> Dict[str, Any]:
+        """Discover several vMix instances concurrently; maps each URL to its result or exception."""
+        sem = asyncio.Semaphore(limit)
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        with self._lock:
-            if self._session is None or self._session.closed:
-                self._session = aiohttp.ClientSession()
-            return self._session
+        async def _one(url: str):
+            async with sem:
+                return await self.discover_vmix_inputs(url)
+
+        results = await asyncio.gather(*(_one(u) for u in api_urls), return_exceptions=True)
+        return dict(zip(api_urls, results))
 
     async def discover_vmix_inputs(self, api_url: str) -> Tuple[List[str], Dict[str, List[str]]]:
+        cached = self._cache.get(api_url)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[2], cached[3]
+        headers = {"If-None-Match": cached[1]} if cached and cached[1] else None
+
+        collector = _VmixInputCollector()
         try:
             session = await self._get_session()
-            async with session.get(api_url, timeout=5) as resp:
-                if resp.status != 200:
-                    raise RuntimeError(f"HTTP {resp.status}: {await resp.text()}")
-                xml_text = await resp.text()
+            async with session.get(api_url, headers=headers) as resp:
+                if resp.status == 304 and cached:
+                    etag = cached[1]
+                    input_names, fields_by_input = cached[2], cached[3]
+                else:
+                    if resp.status != 200:
+                        raise RuntimeError(f"HTTP {resp.status}: {await resp.text()}")
+                    async for chunk in resp.content.iter_chunked(8192):
+                        collector.feed(chunk)
+                    etag = resp.headers.get("ETag")
+                    input_names, fields_by_input = collector.close()
+        except ET.ParseError as e:
+            raise RuntimeError(f"Failed to parse vMix XML: {e}")
         except asyncio.TimeoutError:
             raise RuntimeError("vMix discovery timed out after 5 seconds")
         except Exception as e:
             raise RuntimeError(f"vMix discovery failed: {e}")
 
-        try:
-            root = ET.fromstring(xml_text)
-        except ET.ParseError as e:
-            raise RuntimeError(f"Failed to parse vMix XML: {e}")
-
-        input_names: List[str] = []
-        fields_by_input: Dict[str, List[str]] = {}
-        seen = set()
-
-        for node in root.findall(".//inputs/input"):
-            name = node.get("title") or node.get("shortTitle") or node.get("number") or "Unknown"
-            if name not in seen:
-                input_names.append(name)
-                seen.add(name)
-
-            fields: List[str] = []
-            data_node = node.find("data")
-            if data_node is not None:
-                for t in data_node.findall("text"):
-                    nm = t.get("name")
-                    if nm and nm not in fields:
-                        fields.append(nm)
-            fields_by_input[name] = fields
-
+        self._cache[api_url] = (time.monotonic(), etag, input_names, fields_by_input)
         return input_names, fields_by_input
 
     async def close(self):
-        with self._lock:
-            if self._session and not self._session.closed:
-                try:
-                    asyncio.create_task(self._session.close())
-                except Exception:
-                    pass
-                self._session = None
+        session, self._session = self._session, None
+        if session and not session.closed:
+            try:
+                await session.close()
+            except Exception:
+                pass
 
 
 # =======================
@@ -215,8 +559,11 @@ class ConnectionEditorDialog:
             self.map_tree.column(c, width=200 if c=="input" else 250, stretch=True)
         self.map_tree.pack(side="left", fill="both", expand=True)
 
-        for m in self._mappings:
-            self.map_tree.insert("", "end", values=(m.get("input",""), m.get("field","")))
+        # fill before the scrollbar is wired up so it is only updated once, not per row
+        rows = [(m.get("input", ""), m.get("field", "")) for m in self._mappings]
+        call, path = self.map_tree.tk.call, str(self.map_tree)
+        for values in rows:
+            call(path, "insert", "", "end", "-values", values)
 
         yscroll = ttk.Scrollbar(map_frame, orient="vertical", command=self.map_tree.yview)
         self.map_tree.configure(yscrollcommand=yscroll.set)
@@ -255,7 +602,7 @@ class ConnectionEditorDialog:
             http_port = int(self.http_port_var.get() or "4316")
             ws_port = int(self.ws_port_var.get() or "4317")
             vmix_api = (self.vmix_api_var.get() or "").strip()
-            if not vmix_api.startswith("http://") and not vmix_api.startswith("https://"):
+            if not _URL_RE.match(vmix_api):
                 raise ValueError("vMix API URL must start with http:// or https://")
 
             mappings: List[Dict[str,str]] = []
@@ -265,7 +612,7 @@ class ConnectionEditorDialog:
             if not mappings:
                 raise ValueError("Add at least one mapping (Input → Field).")
 
-            payload = {
+            payload: ConnectionConfig = {
                 "name": name,
                 "openlp_ip": ip,
                 "http_port": http_port,
@@ -282,6 +629,29 @@ class ConnectionEditorDialog:
 # =======================
 # GUI
 # =======================
+def _format_role_row(role: Dict[str, Any]) -> Tuple[str, str, str]:
+    return (
+        role.get("name", "Unnamed"),
+        ", ".join(map(str, role.get("decks") or ())),
+        ", ".join(f"{k} → {v}" for k, v in (role.get("buttons") or {}).items()),
+    )
+
+
+# bound once; map() then formats each mapping without a Python-level loop body
+_MAPPING_FMT = "{0[input]}→{0[field]}".format
+
+
+def _format_connection_row(c: ConnectionConfig) -> Tuple[str, str, str, str, str]:
+    # connections are normalized on load/import, so every key is present
+    return (
+        c["name"],
+        c["openlp_ip"],
+        f"{c['http_port']}/{c['ws_port']}",
+        c["vmix_api_url"],
+        ", ".join(map(_MAPPING_FMT, c["mappings"])),
+    )
+
+
 class LyriSyncGUI:
     """
     LyriSync+ GUI
@@ -297,66 +667,175 @@ class LyriSyncGUI:
         config: Dict[str, Any],
         on_config_save: Callable[[Dict[str, Any]], bool],
         action_callback: Optional[Callable[[Any], Any]] = None,
+        on_settings_applied: Optional[Callable[[Dict[str, Any]], None]] = None,
     ):
         self.master = master
         self.config = config
         self.on_config_save = on_config_save
         self.action_callback = action_callback
+        self.on_settings_applied = on_settings_applied
+        self._save_after_id: Optional[str] = None
+        # single worker keeps writes ordered; YAML dump never runs on the Tk thread
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-save")
 
-        self.discoverer = AsyncVmixDiscoverer()
         self.preach_db = PreachInfoDB(
             (self.config.get("settings") or {}).get("preach_db_path", "lyrisync_preach.db")
         )
         self._preach_rows: List[Dict[str, Any]] = []
 
+        # Cross-thread UI callbacks, drained on the Tk thread by _pump_ui
+        self._ui_queue: deque = deque()
+        self._ui_pump_ms = UI_PUMP_MAX_MS
+        self._ui_pump_id: Optional[str] = None
+
+        # Treeview rows currently shown, [(iid, values)] per tree, and formatted
+        # row values per source dict: id(obj) -> (obj, content key, values)
+        self._tree_rows: Dict[str, List[Tuple[str, Tuple[str, ...]]]] = {}
+        # iid -> source dict per tree, so selection handlers need no positional lookup
+        self._tree_objs: Dict[str, Dict[str, Any]] = {}
+        self._row_cache: Dict[int, Tuple[Any, Any, Tuple[str, ...]]] = {}
+
+        # Connection LED state coalesced by set_conn_status
+        self._status_lock = threading.Lock()
+        self._pending_status: Dict[str, bool] = {}
+        # last requested state per LED (all start off) so repeated polls are no-ops
+        self._led_state: Dict[str, bool] = {"vmix": False, "openlp": False, "rec": False, "ovr": False}
+        self._status_scheduled = False
+
         # Window
         self.master.title("LyriSync+")
         self.master.geometry("1024x680")
         self.master.minsize(880, 560)
 
         # Theme
+        # importing ttkbootstrap also patches ttk widgets to accept bootstyle=
+        import ttkbootstrap as tb
         initial_theme = (self.config.get("ui") or {}).get("theme", "darkly")
         self.style = tb.Style(initial_theme)
 
-        # Async loop for discovery/tasks (used by discover/test vMix)
-        self.loop = asyncio.new_event_loop()
-        self.async_thread = threading.Thread(target=self._run_async_loop, daemon=True)
-        self.async_thread.start()
+        # Async loop for discovery/tasks (used by discover/test vMix); no thread of
+        # its own, _pump_ui steps it from the Tk mainloop. Created by _ensure_async
+        # the first time Settings is opened.
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.discoverer: Optional[AsyncVmixDiscoverer] = None
 
         # Build UI
         self._build_ui()
 
-        # Roles initial fill
+        # Roles initial fill (the other tabs fill themselves when first shown)
         self.refresh_roles_list()
-        # Connections initial fill
-        self.refresh_connections_list()
-        # Preach info initial fill
-        self.refresh_preach_list()
 
         # Close handling
         self.master.protocol("WM_DELETE_WINDOW", self._on_close)
 
-    def _run_async_loop(self):
-        asyncio.set_event_loop(self.loop)
-        try:
-            self.loop.run_forever()
-        finally:
-            try:
-                self.loop.close()
-            except Exception:
-                pass
+        self._pump_ui()
+
+    def _ensure_async(self) -> AsyncVmixDiscoverer:
+        if self.discoverer is None:
+            self.loop = asyncio.new_event_loop()
+            self.discoverer = AsyncVmixDiscoverer(self.loop)
+        return self.discoverer
+
+    def _step_async_loop(self) -> bool:
+        """Run one non-blocking iteration of the asyncio loop; True while it has tasks."""
+        loop = self.loop
+        # is_running: a modal dialog's nested Tk loop fired us from inside a step
+        if loop is None or loop.is_running() or loop.is_closed():
+            return False
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+        return bool(asyncio.all_tasks(loop))
 
     def thread_safe(self, fn: Callable, *args, **kwargs):
-        self.master.after(0, lambda: fn(*args, **kwargs))
+        """Queue fn to run on the Tk thread; safe to call from any thread."""
+        self._ui_queue.append(lambda: fn(*args, **kwargs))
 
-    def _on_close(self):
-        async def _cleanup():
-            await self.discoverer.close()
+    def _pump_ui(self):
+        ran = False
+        while self._ui_queue:
+            try:
+                cb = self._ui_queue.popleft()
+            except IndexError:
+                break
+            try:
+                cb()
+            except Exception as e:
+                logger.error("UI callback failed: %s", e)
+            ran = True
+        async_pending = self._step_async_loop()
+        if ran:
+            self._ui_pump_ms = UI_PUMP_MIN_MS
+        elif async_pending:
+            self._ui_pump_ms = UI_PUMP_ASYNC_MS
+        else:
+            self._ui_pump_ms = min(UI_PUMP_MAX_MS, self._ui_pump_ms * 2)
+        self._ui_pump_id = self.master.after(self._ui_pump_ms, self._pump_ui)
+
+    def _schedule_save(self):
+        """Coalesce config writes from rapid UI edits into one background save."""
+        if self._save_after_id is not None:
+            self.master.after_cancel(self._save_after_id)
+        self._save_after_id = self.master.after(SAVE_DEBOUNCE_MS, self._flush_save_async)
+
+    def _cancel_pending_save(self) -> bool:
+        if self._save_after_id is None:
+            return False
         try:
-            asyncio.run_coroutine_threadsafe(_cleanup(), self.loop)
-            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.master.after_cancel(self._save_after_id)
         except Exception:
             pass
+        self._save_after_id = None
+        return True
+
+    def _submit_save(self) -> Future:
+        # snapshot on the Tk thread so the worker never sees a half-edited config
+        return self._save_executor.submit(self.on_config_save, copy.deepcopy(self.config))
+
+    def _flush_save_async(self):
+        self._save_after_id = None
+        self._submit_save().add_done_callback(self._on_save_done)
+
+    def _on_save_done(self, fut: Future):
+        if fut.exception() is not None or not fut.result():
+            self.thread_safe(messagebox.showerror, "Config Error", "Failed to save configuration.\nSee the log for details.")
+
+    def flush_save(self, only_pending: bool = False) -> bool:
+        """Write the config now (blocking), cancelling any pending debounced save."""
+        if not self._cancel_pending_save() and only_pending:
+            return True
+        try:
+            ok = bool(self._submit_save().result())
+        except Exception as e:
+            logger.error("Failed to save config: %s", e)
+            ok = False
+        if not ok:
+            messagebox.showerror("Config Error", "Failed to save configuration.\nSee the log for details.")
+        return ok
+
+    def shutdown(self):
+        """Stop background work, close the discovery session and flush pending saves.
+
+        Safe to call more than once; does not destroy the window.
+        """
+        if self._ui_pump_id is not None:
+            self.master.after_cancel(self._ui_pump_id)
+            self._ui_pump_id = None
+        if self.loop is not None and not self.loop.is_closed():
+            try:
+                # wait (briefly) for the session to actually close so no sockets are leaked
+                for task in asyncio.all_tasks(self.loop):
+                    task.cancel()
+                self.loop.run_until_complete(asyncio.wait_for(self.discoverer.close(), 1.0))
+            except Exception as e:
+                logger.warning("Discovery shutdown incomplete: %s", e)
+            finally:
+                if not self.loop.is_running():
+                    self.loop.close()
+        self.flush_save(only_pending=True)
+        self._save_executor.shutdown(wait=True)
+
+    def _on_close(self):
+        self.shutdown()
         self.master.destroy()
 
     # -------------------
@@ -374,17 +853,24 @@ class LyriSyncGUI:
         self._vmix_led = self._led_group(status_frame, "vMix")
         self._ovr_led = self._led_group(status_frame, "Overlay")
         self._rec_led = self._led_group(status_frame, "Recording")
+        # shown on the Live Status tab, but updated by set_conn_status before it is built
+        self.vmix_status_var = tk.StringVar(value="Disconnected")
+        self.openlp_status_var = tk.StringVar(value="Disconnected")
 
         right_tools = ttk.Frame(header)
         right_tools.pack(side="right", padx=(0, 12))
         ttk.Label(right_tools, text="Theme:").pack(side="left", padx=(0, 6))
-        themes = ["darkly", "flatly", "cosmo", "pulse", "cyborg", "sandstone", "superhero", "morph", "journal", "simplex"]
         self.theme_var = tk.StringVar(value=self.style.theme.name)
-        theme_dd = ttk.Combobox(right_tools, values=themes, textvariable=self.theme_var, state="readonly", width=12)
+        theme_dd = ttk.Combobox(right_tools, values=THEMES, textvariable=self.theme_var, state="readonly", width=12)
         theme_dd.pack(side="left")
         theme_dd.bind("<<ComboboxSelected>>", self._apply_theme)
         ttk.Button(right_tools, text="Settings", command=self.open_settings_dialog, bootstyle=PRIMARY).pack(side="left", padx=(10, 0))
 
+        # status bar: background refresh errors land here instead of in modal dialogs
+        self._status_var = tk.StringVar()
+        self._status_source: Optional[str] = None
+        ttk.Label(self.master, textvariable=self._status_var, anchor="w").pack(side="bottom", fill="x", padx=12, pady=(0, 6))
+
         notebook = ttk.Notebook(self.master)
         notebook.pack(fill="both", expand=True, padx=10, pady=10)
 
@@ -398,25 +884,52 @@ class LyriSyncGUI:
         notebook.add(self.status_frame, text="📡 Live Status")
         notebook.add(self.preach_frame, text="📖 Preach Info")
 
+        # only the visible tab is built now; the rest on first <<NotebookTabChanged>>
         self._build_roles_tab()
-        self._build_connections_tab()
-        self._build_status_tab()
-        self._build_preach_tab()
+        self._lazy_tabs: Dict[str, Tuple[Callable[[], None], ...]] = {
+            str(self.connections_frame): (self._build_connections_tab, self.refresh_connections_list),
+            str(self.status_frame): (self._build_status_tab,),
+            str(self.preach_frame): (self._build_preach_tab, self.refresh_preach_list),
+        }
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        for build in self._lazy_tabs.pop(event.widget.select(), ()):
+            build()
 
-    def _led_group(self, parent: ttk.Frame, caption: str) -> ttk.Label:
+    def _set_status(self, source: str, msg: str = ""):
+        """Show msg in the status bar; an empty msg clears it only if source put it there."""
+        if msg or self._status_source == source:
+            self._status_var.set(msg)
+            self._status_source = source if msg else None
+
+    def _led_group(self, parent: ttk.Frame, caption: str) -> Tuple[tk.Canvas, int]:
         frame = ttk.Frame(parent)
         frame.pack(side="left", padx=8)
         ttk.Label(frame, text=caption, font=("Segoe UI", 9)).pack()
-        lbl = ttk.Label(frame, text="●", font=("Segoe UI", 12), foreground="#c43c3c")
-        lbl.pack()
-        return lbl
+        # a canvas oval: recolouring is one itemconfigure, no ttk style lookup
+        cv = tk.Canvas(frame, width=12, height=12, highlightthickness=0, background=self.style.colors.bg)
+        oval = cv.create_oval(1, 1, 11, 11, fill=LED_OFF, outline="")
+        cv.pack(pady=4)
+        return cv, oval
+
+    @staticmethod
+    def _set_led(led: Tuple[tk.Canvas, int], is_on: bool):
+        cv, oval = led
+        cv.itemconfigure(oval, fill=LED_ON if is_on else LED_OFF)
 
     def _apply_theme(self, _event=None):
         chosen = self.theme_var.get()
+        if chosen == self.style.theme.name:
+            return  # re-selecting the current theme would rebuild every style for nothing
         try:
             self.style.theme_use(chosen)
+            # plain tk canvases don't follow ttk themes
+            bg = self.style.colors.bg
+            for cv, _ in (self._openlp_led, self._vmix_led, self._ovr_led, self._rec_led):
+                cv.configure(background=bg)
             self.config.setdefault("ui", {})["theme"] = chosen
-            save_config(self.config)
+            self._schedule_save()
         except Exception as e:
             logger.error("Failed to apply theme: %s", e)
             messagebox.showerror("Theme Error", f"Failed to apply theme:\n{e}")
@@ -461,43 +974,110 @@ class LyriSyncGUI:
         ttk.Button(btns, text="❌ Delete Role", command=self.delete_role, bootstyle=DANGER).pack(side="left", padx=5)
         ttk.Button(btns, text="🔄 Refresh", command=self.refresh_roles_list).pack(side="left", padx=5)
 
+    def _cached_row(self, obj: Any, key: Any, fmt: Callable[[Any], Tuple[str, ...]]) -> Tuple[str, ...]:
+        """Formatted row values for obj, rebuilt only when its content key changes."""
+        hit = self._row_cache.get(id(obj))
+        if hit is not None and hit[0] is obj and hit[1] == key:
+            return hit[2]
+        values = fmt(obj)
+        self._row_cache[id(obj)] = (obj, key, values)
+        return values
+
+    def _prune_row_cache(self):
+        live = {id(r) for r in self.config.get("roles", [])}
+        live.update(id(c) for c in self.config.get("settings", {}).get("connections", []) or [])
+        for k in [k for k in self._row_cache if k not in live]:
+            del self._row_cache[k]
+
+    def _sync_tree(self, tree: ttk.Treeview, rows: List[Tuple[str, ...]], objs: List[Any]):
+        """Make tree show rows (built from objs), touching only the rows that differ."""
+        shown = self._tree_rows.setdefault(str(tree), [])
+        if [iid for iid, _ in shown] != list(tree.get_children()):
+            # modified behind our back: start over
+            tree.delete(*tree.get_children())
+            shown.clear()
+        n = min(len(shown), len(rows))
+        for i in range(n):
+            iid, old = shown[i]
+            if old != rows[i]:
+                tree.item(iid, values=rows[i])
+                shown[i] = (iid, rows[i])
+        if len(shown) > n:
+            tree.delete(*[iid for iid, _ in shown[n:]])
+            del shown[n:]
+        elif len(rows) > n:
+            # detach the scrollbar so it isn't updated once per inserted row
+            yscroll_cmd = tree.cget("yscrollcommand")
+            tree.configure(yscrollcommand="")
+            try:
+                # call the Tcl command directly: skips ttk.Treeview.insert's option formatting per row
+                call, path = tree.tk.call, str(tree)
+                for values in rows[n:]:
+                    shown.append((call(path, "insert", "", "end", "-values", values), values))
+            finally:
+                tree.configure(yscrollcommand=yscroll_cmd)
+        self._tree_objs[str(tree)] = {iid: obj for (iid, _), obj in zip(shown, objs)}
+
+    def _selected_obj(self, tree: ttk.Treeview) -> Optional[Any]:
+        """Source dict behind the first selected row, or None."""
+        sel = tree.selection()
+        return self._tree_objs.get(str(tree), {}).get(sel[0]) if sel else None
+
+    @staticmethod
+    def _index_of(seq: List[Any], obj: Any) -> int:
+        # identity, not ==: two roles/connections may have equal content
+        return next((i for i, x in enumerate(seq) if x is obj), -1)
+
     def refresh_roles_list(self):
         try:
-            for iid in self.roles_tree.get_children():
-                self.roles_tree.delete(iid)
-            for role in self.config.get("roles", []):
-                decks = ", ".join(str(d) for d in role.get("decks", []))
-                buttons = ", ".join([f"{k} → {v}" for k, v in role.get("buttons", {}).items()])
-                self.roles_tree.insert("", "end", values=(role.get("name", "Unnamed"), decks, buttons))
+            roles = self.config.get("roles", [])
+            rows = [
+                self._cached_row(
+                    role,
+                    (role.get("name"), tuple(role.get("decks") or ()), tuple((role.get("buttons") or {}).items())),
+                    _format_role_row,
+                )
+                for role in roles
+            ]
+            self._sync_tree(self.roles_tree, rows, roles)
+            self._prune_row_cache()
+            self._set_status("roles")
         except Exception as e:
-            logger.error("Refresh roles failed: %s", e)
-            messagebox.showerror("Roles Error", f"Failed to refresh roles:\n{e}")
+            logger.exception("Refresh roles failed")
+            self._set_status("roles", f"Roles refresh failed: {e}")
 
     def add_role(self):
         RoleEditorDialog(self.master, None, None, self.config, self._on_role_saved).show()
 
     def edit_role(self):
-        sel = self.roles_tree.selection()
-        if not sel:
+        role = self._selected_obj(self.roles_tree)
+        if role is None:
             messagebox.showwarning("Select Role", "Please select a role to edit.")
             return
+        idx = self._index_of(self.config["roles"], role)
+        if idx < 0:
+            # the list changed under the selection (reload/delete); a -1 would overwrite the last role
+            messagebox.showwarning("Select Role", "That role no longer exists; the list has been refreshed.")
+            self.refresh_roles_list()
+            return
         try:
-            idx = self.roles_tree.index(sel[0])
-            role = self.config["roles"][idx]
             RoleEditorDialog(self.master, role, idx, self.config, self._on_role_saved).show()
         except Exception as e:
             messagebox.showerror("Edit Error", f"Failed to edit role:\n{e}")
 
     def delete_role(self):
-        sel = self.roles_tree.selection()
-        if not sel:
+        role = self._selected_obj(self.roles_tree)
+        if role is None:
             return
-        idx = self.roles_tree.index(sel[0])
-        role_name = self.config["roles"][idx].get("name", "Unnamed")
+        role_name = role.get("name", "Unnamed")
         if messagebox.askyesno("Confirm Delete", f"Delete role '{role_name}'?"):
-            del self.config["roles"][idx]
+            roles = self.config["roles"]
+            idx = self._index_of(roles, role)
+            if idx < 0:
+                return
+            del roles[idx]
             self.refresh_roles_list()
-            save_config(self.config)
+            self._schedule_save()
 
     def _on_role_saved(self, new_role, role_index):
         if role_index is not None:
@@ -505,7 +1085,7 @@ class LyriSyncGUI:
         else:
             self.config["roles"].append(new_role)
         self.refresh_roles_list()
-        save_config(self.config)
+        self._schedule_save()
 
     # -------------------
     # Connections tab
@@ -547,29 +1127,29 @@ class LyriSyncGUI:
         ttk.Button(btns, text="✏️ Edit", command=self._edit_connection).pack(side="left", padx=5)
         ttk.Button(btns, text="❌ Delete", command=self._delete_connection, bootstyle=DANGER).pack(side="left", padx=5)
         ttk.Button(btns, text="📥 Import JSON…", command=self._import_connections_json, bootstyle=INFO).pack(side="left", padx=5)
+        ttk.Button(btns, text="📤 Export JSON…", command=self._export_connections_json, bootstyle=INFO).pack(side="left", padx=5)
         ttk.Button(btns, text="💾 Save", command=self._save_connections, bootstyle=SUCCESS).pack(side="left", padx=5)
 
     def refresh_connections_list(self):
         try:
-            for iid in self.conn_tree.get_children():
-                self.conn_tree.delete(iid)
             conns = self.config.get("settings", {}).get("connections", []) or []
-            for c in conns:
-                maps = ", ".join([f"{m.get('input','')}→{m.get('field','')}" for m in c.get("mappings", [])])
-                ports = f"{c.get('http_port',4316)}/{c.get('ws_port',4317)}"
-                self.conn_tree.insert(
-                    "", "end",
-                    values=(
-                        c.get("name", "Connection"),
-                        c.get("openlp_ip", "127.0.0.1"),
-                        ports,
-                        c.get("vmix_api_url", ""),
-                        maps
-                    )
+            rows = [
+                self._cached_row(
+                    c,
+                    (
+                        c["name"], c["openlp_ip"], c["http_port"], c["ws_port"], c["vmix_api_url"],
+                        tuple((m["input"], m["field"]) for m in c["mappings"]),
+                    ),
+                    _format_connection_row,
                 )
+                for c in conns
+            ]
+            self._sync_tree(self.conn_tree, rows, conns)
+            self._prune_row_cache()
+            self._set_status("connections")
         except Exception as e:
-            logger.error("Refresh connections failed: %s", e)
-            messagebox.showerror("Connections Error", f"Failed to refresh connections:\n{e}")
+            logger.exception("Refresh connections failed")
+            self._set_status("connections", f"Connections refresh failed: {e}")
 
     def _add_connection(self):
         def _on_save(new_conn: Dict[str, Any]):
@@ -578,29 +1158,29 @@ class LyriSyncGUI:
         ConnectionEditorDialog(self.master, on_save=_on_save).show()
 
     def _edit_connection(self):
-        sel = self.conn_tree.selection()
-        if not sel:
+        conn = self._selected_obj(self.conn_tree)
+        if conn is None:
             messagebox.showwarning("Select", "Select a connection to edit.")
             return
-        idx = self.conn_tree.index(sel[0])
         conns = self.config["settings"].get("connections", [])
-        if idx >= len(conns):
-            return
         def _on_save(updated: Dict[str, Any]):
+            idx = self._index_of(conns, conn)
+            if idx < 0:
+                return
             conns[idx] = updated
             self.refresh_connections_list()
-        ConnectionEditorDialog(self.master, on_save=_on_save, seed=conns[idx]).show()
+        ConnectionEditorDialog(self.master, on_save=_on_save, seed=conn).show()
 
     def _delete_connection(self):
-        sel = self.conn_tree.selection()
-        if not sel:
-            return
-        idx = self.conn_tree.index(sel[0])
-        conns = self.config["settings"].get("connections", [])
-        if idx >= len(conns):
+        conn = self._selected_obj(self.conn_tree)
+        if conn is None:
             return
-        name = conns[idx].get("name", "Connection")
+        name = conn.get("name", "Connection")
         if messagebox.askyesno("Confirm Delete", f"Delete connection '{name}'?"):
+            conns = self.config["settings"].get("connections", [])
+            idx = self._index_of(conns, conn)
+            if idx < 0:
+                return
             del conns[idx]
             self.refresh_connections_list()
 
@@ -612,22 +1192,30 @@ class LyriSyncGUI:
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict) and "connections" in data:
-                conns = data["connections"]
-            else:
-                conns = data
-            if not isinstance(conns, list):
-                raise ValueError('JSON must be a list of connection objects or {"connections": [...]}')
+            conns = read_connections_json(path)
             self.config["settings"]["connections"] = conns
             self.refresh_connections_list()
             messagebox.showinfo("Import JSON", f"Loaded {len(conns)} connection(s). Click Save to persist.")
         except Exception as e:
             messagebox.showerror("Import JSON", f"Failed to import:\n{e}")
 
+    def _export_connections_json(self):
+        path = filedialog.asksaveasfilename(
+            title="Export connections",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            conns = self.config.get("settings", {}).get("connections", []) or []
+            write_connections_json(path, conns)
+            messagebox.showinfo("Export JSON", f"Exported {len(conns)} connection(s).")
+        except Exception as e:
+            messagebox.showerror("Export JSON", f"Failed to export:\n{e}")
+
     def _save_connections(self):
-        if save_config(self.config):
+        if self.flush_save():
             messagebox.showinfo("Connections", "Connections saved to config.")
 
     # -------------------
@@ -660,9 +1248,10 @@ class LyriSyncGUI:
         # default text
         self._lyrics_text.insert("1.0", "SAMPLE LYRICS")
 
-        # auto-grow binding (on change and key press)
+        # auto-grow binding (<<Modified>> fires on every edit, typed or pasted)
+        self._lyrics_height = 2
+        self._autogrow_pending = False
         self._lyrics_text.bind("<<Modified>>", self._autogrow_text)
-        self._lyrics_text.bind("<KeyRelease>", self._autogrow_text)
 
         ttk.Button(test, text="Show Lyrics", command=self._send_test_lyrics, bootstyle=SUCCESS).grid(row=0, column=2, padx=6, pady=5, sticky="n")
         ttk.Button(test, text="Clear", command=self._clear_lyrics, bootstyle=DANGER).grid(row=0, column=3, padx=0, pady=5, sticky="n")
@@ -677,11 +1266,9 @@ class LyriSyncGUI:
         conn = ttk.LabelFrame(self.status_frame, text="Connection Status", padding=10)
         conn.pack(fill="x", padx=10, pady=(6, 10))
         ttk.Label(conn, text="vMix:").grid(row=0, column=0, sticky="w")
-        self.vmix_status_var = tk.StringVar(value="Disconnected")
         ttk.Label(conn, textvariable=self.vmix_status_var, foreground="red").grid(row=0, column=1, padx=4)
 
         ttk.Label(conn, text="OpenLP:").grid(row=0, column=2, sticky="w")
-        self.openlp_status_var = tk.StringVar(value="Disconnected")
         ttk.Label(conn, textvariable=self.openlp_status_var, foreground="red").grid(row=0, column=3, padx=4)
 
         # column/row growth
@@ -751,34 +1338,26 @@ class LyriSyncGUI:
 
     def refresh_preach_list(self):
         try:
-            for iid in self.preach_tree.get_children():
-                self.preach_tree.delete(iid)
             self._preach_rows = self.preach_db.list_entries()
-            for row in self._preach_rows:
-                self.preach_tree.insert(
-                    "",
-                    "end",
-                    values=(
-                        row.get("id"),
-                        row.get("name", ""),
-                        row.get("title", ""),
-                        row.get("scriptures", ""),
-                        row.get("inspirations", ""),
-                        row.get("subjects", ""),
-                    ),
+            rows = [
+                (
+                    row.get("id"),
+                    row.get("name", ""),
+                    row.get("title", ""),
+                    row.get("scriptures", ""),
+                    row.get("inspirations", ""),
+                    row.get("subjects", ""),
                 )
+                for row in self._preach_rows
+            ]
+            self._sync_tree(self.preach_tree, rows, self._preach_rows)
+            self._set_status("preach")
         except Exception as e:
-            logger.error("Refresh preach info failed: %s", e)
-            messagebox.showerror("Preach Info", f"Failed to load preach info:\n{e}")
+            logger.exception("Refresh preach info failed")
+            self._set_status("preach", f"Failed to load preach info: {e}")
 
     def _selected_preach_row(self) -> Optional[Dict[str, Any]]:
-        sel = self.preach_tree.selection()
-        if not sel:
-            return None
-        idx = self.preach_tree.index(sel[0])
-        if idx < 0 or idx >= len(self._preach_rows):
-            return None
-        return self._preach_rows[idx]
+        return self._selected_obj(self.preach_tree)
 
     def _add_preach(self):
         PreachInfoEditorDialog(self.master, on_save=self._on_preach_created).show()
@@ -830,14 +1409,25 @@ class LyriSyncGUI:
     def _autogrow_text(self, event=None):
         """Auto-adjust Text height between 2 and 6 lines based on content."""
         try:
-            if event and str(event.type) == "<<Modified>>":
+            # re-arm: <<Modified>> only fires when the modified flag flips
+            if self._lyrics_text.edit_modified():
                 self._lyrics_text.edit_modified(False)
+        except Exception:
+            pass
+        # coalesce a burst of edits into one measurement
+        if self._autogrow_pending:
+            return
+        self._autogrow_pending = True
+        self.master.after_idle(self._do_autogrow)
+
+    def _do_autogrow(self):
+        self._autogrow_pending = False
+        try:
             total_lines = int(self._lyrics_text.index("end-1c").split(".")[0])
-            min_lines, max_lines = 2, 6
-            new_h = max(min_lines, min(max_lines, total_lines))
-            current_h = int(self._lyrics_text.cget("height"))
-            if new_h != current_h:
+            new_h = max(2, min(6, total_lines))
+            if new_h != self._lyrics_height:
                 self._lyrics_text.configure(height=new_h)
+                self._lyrics_height = new_h
         except Exception:
             pass
 
@@ -866,29 +1456,64 @@ class LyriSyncGUI:
     # -------------------
     # LED + connection updates (called from main)
     # -------------------
+    def _led_changed(self, key: str, is_on: bool) -> bool:
+        # caller holds _status_lock
+        if self._led_state[key] == is_on:
+            return False
+        self._led_state[key] = is_on
+        return True
+
     def set_recording(self, is_on: bool):
-        self.thread_safe(self._rec_led.configure, foreground="#2ca34a" if is_on else "#c43c3c")
+        self.apply_state(recording=is_on)
 
     def set_overlay(self, is_on: bool):
-        self.thread_safe(self._ovr_led.configure, foreground="#2ca34a" if is_on else "#c43c3c")
+        self.apply_state(overlay=is_on)
 
     def set_conn_status(self, vmix_ok=None, openlp_ok=None):
-        if vmix_ok is not None:
-            self.thread_safe(self._vmix_led.configure, foreground="#2ca34a" if vmix_ok else "#c43c3c")
-            self.thread_safe(self.vmix_status_var.set, "Connected" if vmix_ok else "Disconnected")
-        if openlp_ok is not None:
-            self.thread_safe(self._openlp_led.configure, foreground="#2ca34a" if openlp_ok else "#c43c3c")
-            self.thread_safe(self.openlp_status_var.set, "Connected" if openlp_ok else "Disconnected")
+        self.apply_state(vmix_ok=vmix_ok, openlp_ok=openlp_ok)
+
+    def apply_state(self, vmix_ok=None, openlp_ok=None, recording=None, overlay=None):
+        """
+        Update any of the four status LEDs from any thread; None leaves one as is.
+        Changes are merged into one pending snapshot, applied by a single UI callback.
+        """
+        with self._status_lock:
+            for key, value in (("vmix", vmix_ok), ("openlp", openlp_ok), ("rec", recording), ("ovr", overlay)):
+                if value is not None and self._led_changed(key, bool(value)):
+                    self._pending_status[key] = bool(value)
+            if self._status_scheduled or not self._pending_status:
+                return
+            self._status_scheduled = True
+        self.thread_safe(self._apply_pending_status)
+
+    def _apply_pending_status(self):
+        with self._status_lock:
+            pending, self._pending_status = self._pending_status, {}
+            self._status_scheduled = False
+        if "vmix" in pending:
+            ok = pending["vmix"]
+            self._set_led(self._vmix_led, ok)
+            self.vmix_status_var.set("Connected" if ok else "Disconnected")
+        if "openlp" in pending:
+            ok = pending["openlp"]
+            self._set_led(self._openlp_led, ok)
+            self.openlp_status_var.set("Connected" if ok else "Disconnected")
+        if "rec" in pending:
+            self._set_led(self._rec_led, pending["rec"])
+        if "ovr" in pending:
+            self._set_led(self._ovr_led, pending["ovr"])
 
     # -------------------
     # Settings
     # -------------------
     def open_settings_dialog(self):
-        SettingsDialog(self.master, self.config, self.discoverer, self._apply_settings).show()
+        SettingsDialog(self.master, self.config, self._ensure_async(), self._apply_settings).show()
 
     def _apply_settings(self, new_settings: Dict[str, Any]):
         self.config["settings"] = new_settings
-        save_config(self.config)
+        self._schedule_save()
+        if callable(self.on_settings_applied):
+            self.on_settings_applied(new_settings)
 
 
 # =======================
@@ -993,12 +1618,12 @@ class RoleEditorDialog:
         name_e.grid(row=0, column=1, sticky="ew", padx=8)
 
         ttk.Label(frm, text="Deck IDs (comma-separated):").grid(row=1, column=0, sticky="w", pady=6)
-        self.decks_var = tk.StringVar(value=", ".join(str(d) for d in self.role.get("decks", [])))
+        self.decks_var = tk.StringVar(value=", ".join(map(str, self.role.get("decks") or ())))
         ttk.Entry(frm, textvariable=self.decks_var).grid(row=1, column=1, sticky="ew", padx=8)
 
         ttk.Label(frm, text="Button Mappings (key:action, comma-separated):").grid(row=2, column=0, sticky="w", pady=6)
         self.buttons_var = tk.StringVar(
-            value=", ".join([f"{k}:{v}" for k, v in (self.role.get("buttons", {}) or {}).items()])
+            value=", ".join(f"{k}:{v}" for k, v in (self.role.get("buttons") or {}).items())
         )
         ttk.Entry(frm, textvariable=self.buttons_var).grid(row=2, column=1, sticky="ew", padx=8)
 
@@ -1020,18 +1645,8 @@ class RoleEditorDialog:
                 messagebox.showerror("Validation", "Role name is required.")
                 return
 
-            decks: List[int] = []
-            for part in (self.decks_var.get() or "").split(","):
-                part = part.strip()
-                if part.isdigit():
-                    decks.append(int(part))
-
-            buttons: Dict[str, str] = {}
-            for item in (self.buttons_var.get() or "").split(","):
-                item = item.strip()
-                if ":" in item:
-                    k, v = item.split(":", 1)
-                    buttons[k.strip()] = v.strip()
+            decks: List[int] = list(map(int, _DECK_ID_RE.findall(self.decks_var.get() or "")))
+            buttons: Dict[str, str] = dict(_BUTTON_MAP_RE.findall(self.buttons_var.get() or ""))
 
             self.on_save({"name": name, "decks": decks, "buttons": buttons}, self.role_index)
             self.window.destroy()
@@ -1042,6 +1657,54 @@ class RoleEditorDialog:
 # =======================
 # Settings dialog
 # =======================
+# Named Tk font shared by every section header; created once per interpreter
+SECTION_FONT = "TkSectionHeader"
+# keep a reference: tkfont.Font deletes its named font when garbage-collected
+_section_font: Optional[tkfont.Font] = None
+
+
+def _ensure_section_font(master: tk.Misc) -> str:
+    global _section_font
+    if SECTION_FONT not in tkfont.names(master):
+        _section_font = tkfont.Font(root=master, name=SECTION_FONT, family="Segoe UI", size=12, weight="bold")
+    return SECTION_FONT
+
+# Declarative layout for SettingsDialog; also drives variable setup and _save_settings.
+# (kind, label, var attribute, settings key, default, options)
+#   kind: "header" | "entry" | "combo" | "check"
+#   options: width, sticky, values, widget (attr to store the widget on),
+#            button ((text, method name) placed in column 2), int ((min, max) clamp),
+#            url (value must match _URL_RE)
+_SETTINGS_FIELDS: Tuple[Tuple[str, str, Optional[str], Optional[str], Any, Dict[str, Any]], ...] = (
+    ("header", "vMix Settings", None, None, None, {"pady": (0, 10)}),
+    ("entry", "vMix API URL:", "vmix_api_var", "vmix_api_url", "http://localhost:8088/api", {"width": 44, "sticky": "ew", "url": True}),
+    ("combo", "vMix Input:", "input_var", "vmix_title_input", "SongTitle",
+     {"width": 30, "sticky": "ew", "widget": "input_combo", "button": ("Discover", "_discover_inputs")}),
+    ("combo", "vMix Field:", "field_var", "vmix_title_field", "Message.Text", {"width": 30, "sticky": "ew", "widget": "field_combo"}),
+
+    ("header", "OpenLP Settings", None, None, None, {}),
+    ("entry", "OpenLP WS URL:", "openlp_ws_var", "openlp_ws_url", "ws://localhost:4317", {"width": 44, "sticky": "ew"}),
+
+    ("header", "API Settings", None, None, None, {}),
+    ("entry", "LyriSync+ API Port:", "api_port_var", "api_port", 5000, {"width": 10, "int": (1024, 65535)}),
+
+    ("header", "Overlay Settings", None, None, None, {}),
+    ("combo", "Overlay Channel (1-4):", "overlay_var", "overlay_channel", 1, {"width": 6, "values": ("1", "2", "3", "4"), "int": (1, 4)}),
+    ("check", "Auto Overlay on Send", "aoin_var", "auto_overlay_on_send", True, {}),
+    ("check", "Overlay Out on Clear", "aoout_var", "auto_overlay_out_on_clear", True, {}),
+    ("check", "Overlay Always On", "always_on_var", "overlay_always_on", False, {}),
+    ("check", "Clear on Blank Slide", "cob_var", "clear_on_blank", True, {}),
+    ("check", "Title layer above text (vMix title)", "text_layer_above_var", "text_layer_above", False, {}),
+    ("check", "Show Splash Screen", "splash_var", "splash_enabled", True, {}),
+
+    # Text / timing
+    ("entry", "Max Chars per Line:", "wrap_var", "max_chars_per_line", 36, {"width": 10, "int": (10, None)}),
+    ("entry", "Auto-Clear Idle (sec, 0=off):", "idle_var", "auto_clear_idle_sec", 0, {"width": 10, "int": (0, None)}),
+    ("entry", "Poll Interval (sec):", "poll_var", "poll_interval_sec", 2, {"width": 10, "int": (1, None)}),
+    ("entry", "Slide Debounce (ms):", "debounce_var", "show_debounce_ms", 50, {"width": 10, "int": (0, 1000)}),
+)
+
+
 class SettingsDialog:
     def __init__(self, parent, config: Dict[str, Any], discoverer: AsyncVmixDiscoverer, on_apply: Callable[[Dict[str, Any]], None]):
         self.parent = parent
@@ -1051,21 +1714,14 @@ class SettingsDialog:
         self.window: Optional[tk.Toplevel] = None
 
         s = self.config.get("settings", {})
-        self.vmix_api_var = tk.StringVar(value=s.get("vmix_api_url", "http://localhost:8088/api"))
-        self.openlp_ws_var = tk.StringVar(value=s.get("openlp_ws_url", "ws://localhost:4317"))
-        self.api_port_var = tk.StringVar(value=str(s.get("api_port", 5000)))
-        self.input_var = tk.StringVar(value=s.get("vmix_title_input", "SongTitle"))
-        self.field_var = tk.StringVar(value=s.get("vmix_title_field", "Message.Text"))
-        self.splash_var = tk.BooleanVar(value=bool(s.get("splash_enabled", True)))
-        self.poll_var = tk.StringVar(value=str(s.get("poll_interval_sec", 2)))
-        self.overlay_var = tk.StringVar(value=str(s.get("overlay_channel", 1)))
-        self.aoin_var = tk.BooleanVar(value=bool(s.get("auto_overlay_on_send", True)))
-        self.aoout_var = tk.BooleanVar(value=bool(s.get("auto_overlay_out_on_clear", True)))
-        self.always_on_var = tk.BooleanVar(value=bool(s.get("overlay_always_on", False)))
-        self.idle_var = tk.StringVar(value=str(s.get("auto_clear_idle_sec", 0)))
-        self.wrap_var = tk.StringVar(value=str(s.get("max_chars_per_line", 36)))
-        self.cob_var = tk.BooleanVar(value=bool(s.get("clear_on_blank", True)))
-        self.text_layer_above_var = tk.BooleanVar(value=bool(s.get("text_layer_above", False)))
+        for kind, _label, var_name, key, default, _opts in _SETTINGS_FIELDS:
+            if key is None:
+                continue
+            if kind == "check":
+                var = tk.BooleanVar(value=bool(s.get(key, default)))
+            else:
+                var = tk.StringVar(value=str(s.get(key, default)))
+            setattr(self, var_name, var)
 
         # connections viewer (imported JSON lives here until Save)
         self.connections: List[Dict[str, Any]] = list(s.get("connections", []))
@@ -1079,65 +1735,41 @@ class SettingsDialog:
 
         main = ttk.Frame(self.window, padding=12)
         main.pack(fill="both", expand=True)
-
-        # vMix
-        ttk.Label(main, text="vMix Settings", font=("Segoe UI", 12, "bold")).grid(row=0, column=0, columnspan=4, sticky="w", pady=(0, 10))
-        ttk.Label(main, text="vMix API URL:").grid(row=1, column=0, sticky="w", pady=5)
-        ttk.Entry(main, textvariable=self.vmix_api_var, width=44).grid(row=1, column=1, sticky="ew", padx=6)
-
-        ttk.Label(main, text="vMix Input:").grid(row=2, column=0, sticky="w", pady=5)
-        self.input_combo = ttk.Combobox(main, textvariable=self.input_var, state="readonly", width=30)
-        self.input_combo.grid(row=2, column=1, sticky="ew", padx=6)
-        ttk.Button(main, text="Discover", command=self._discover_inputs).grid(row=2, column=2, padx=6)
-
-        ttk.Label(main, text="vMix Field:").grid(row=3, column=0, sticky="w", pady=5)
-        self.field_combo = ttk.Combobox(main, textvariable=self.field_var, state="readonly", width=30)
-        self.field_combo.grid(row=3, column=1, sticky="ew", padx=6)
-
-        # OpenLP
-        ttk.Label(main, text="OpenLP Settings", font=("Segoe UI", 12, "bold")).grid(row=4, column=0, columnspan=4, sticky="w", pady=(18, 10))
-        ttk.Label(main, text="OpenLP WS URL:").grid(row=5, column=0, sticky="w", pady=5)
-        ttk.Entry(main, textvariable=self.openlp_ws_var, width=44).grid(row=5, column=1, sticky="ew", padx=6)
-
-        # API
-        ttk.Label(main, text="API Settings", font=("Segoe UI", 12, "bold")).grid(row=6, column=0, columnspan=4, sticky="w", pady=(18, 10))
-        ttk.Label(main, text="LyriSync+ API Port:").grid(row=7, column=0, sticky="w", pady=5)
-        ttk.Entry(main, textvariable=self.api_port_var, width=10).grid(row=7, column=1, sticky="w", padx=6)
-
-        # Overlay
-        ttk.Label(main, text="Overlay Settings", font=("Segoe UI", 12, "bold")).grid(row=8, column=0, columnspan=4, sticky="w", pady=(18, 10))
-        ttk.Label(main, text="Overlay Channel (1-4):").grid(row=9, column=0, sticky="w", pady=5)
-        ttk.Combobox(main, textvariable=self.overlay_var, values=["1", "2", "3", "4"], state="readonly", width=6).grid(row=9, column=1, sticky="w", padx=6)
-
-        ttk.Checkbutton(main, text="Auto Overlay on Send", variable=self.aoin_var).grid(row=10, column=0, columnspan=2, sticky="w", pady=4)
-        ttk.Checkbutton(main, text="Overlay Out on Clear", variable=self.aoout_var).grid(row=11, column=0, columnspan=2, sticky="w", pady=4)
-        ttk.Checkbutton(main, text="Overlay Always On", variable=self.always_on_var).grid(row=12, column=0, columnspan=2, sticky="w", pady=4)
-        ttk.Checkbutton(main, text="Clear on Blank Slide", variable=self.cob_var).grid(row=13, column=0, columnspan=2, sticky="w", pady=4)
-        ttk.Checkbutton(main, text="Title layer above text (vMix title)", variable=self.text_layer_above_var).grid(row=14, column=0, columnspan=2, sticky="w", pady=4)
-        ttk.Checkbutton(main, text="Show Splash Screen", variable=self.splash_var).grid(row=15, column=0, columnspan=2, sticky="w", pady=4)
-
-        # Text / timing
-        ttk.Label(main, text="Max Chars per Line:").grid(row=16, column=0, sticky="w", pady=5)
-        ttk.Entry(main, textvariable=self.wrap_var, width=10).grid(row=16, column=1, sticky="w", padx=6)
-
-        ttk.Label(main, text="Auto-Clear Idle (sec, 0=off):").grid(row=17, column=0, sticky="w", pady=5)
-        ttk.Entry(main, textvariable=self.idle_var, width=10).grid(row=17, column=1, sticky="w", padx=6)
-
-        ttk.Label(main, text="Poll Interval (sec):").grid(row=18, column=0, sticky="w", pady=5)
-        ttk.Entry(main, textvariable=self.poll_var, width=10).grid(row=18, column=1, sticky="w", padx=6)
+        _ensure_section_font(self.window)
+
+        for row, (kind, label, var_name, _key, _default, opts) in enumerate(_SETTINGS_FIELDS):
+            if kind == "header":
+                ttk.Label(main, text=label, font=SECTION_FONT).grid(row=row, column=0, columnspan=4, sticky="w", pady=opts.get("pady", (18, 10)))
+                continue
+            var = getattr(self, var_name)
+            if kind == "check":
+                ttk.Checkbutton(main, text=label, variable=var).grid(row=row, column=0, columnspan=2, sticky="w", pady=4)
+                continue
+            ttk.Label(main, text=label).grid(row=row, column=0, sticky="w", pady=5)
+            if kind == "entry":
+                widget = ttk.Entry(main, textvariable=var, width=opts["width"])
+            else:
+                widget = ttk.Combobox(main, textvariable=var, values=opts.get("values", ()), state="readonly", width=opts["width"])
+            widget.grid(row=row, column=1, sticky=opts.get("sticky", "w"), padx=6)
+            if "widget" in opts:
+                setattr(self, opts["widget"], widget)
+            if "button" in opts:
+                text, method = opts["button"]
+                ttk.Button(main, text=text, command=getattr(self, method)).grid(row=row, column=2, padx=6)
+        r = len(_SETTINGS_FIELDS)
 
         # JSON / Quick Add
-        sep = ttk.Separator(main); sep.grid(row=19, column=0, columnspan=4, sticky="ew", pady=(14, 8))
-        ttk.Label(main, text="Multi-Connection", font=("Segoe UI", 12, "bold")).grid(row=20, column=0, columnspan=4, sticky="w", pady=(0, 8))
+        sep = ttk.Separator(main); sep.grid(row=r, column=0, columnspan=4, sticky="ew", pady=(14, 8))
+        ttk.Label(main, text="Multi-Connection", font=SECTION_FONT).grid(row=r + 1, column=0, columnspan=4, sticky="w", pady=(0, 8))
         self.conn_info_var = tk.StringVar(value=self._connections_summary())
-        ttk.Label(main, textvariable=self.conn_info_var).grid(row=21, column=0, columnspan=2, sticky="w")
-        btn_group = ttk.Frame(main); btn_group.grid(row=21, column=2, columnspan=2, sticky="e")
+        ttk.Label(main, textvariable=self.conn_info_var).grid(row=r + 2, column=0, columnspan=2, sticky="w")
+        btn_group = ttk.Frame(main); btn_group.grid(row=r + 2, column=2, columnspan=2, sticky="e")
         ttk.Button(btn_group, text="Quick Add Connection…", command=self._quick_add_connection).pack(side="left", padx=(0,6))
         ttk.Button(btn_group, text="Import JSON…", command=self._import_json, bootstyle=INFO).pack(side="left")
 
         # Bottom buttons
         btns = ttk.Frame(main)
-        btns.grid(row=22, column=0, columnspan=4, pady=18, sticky="e")
+        btns.grid(row=r + 3, column=0, columnspan=4, pady=18, sticky="e")
         ttk.Button(btns, text="Test vMix Connection", command=self._test_vmix).pack(side="left", padx=6)
         ttk.Button(btns, text="Save", command=self._save_settings, bootstyle=SUCCESS).pack(side="left", padx=6)
         ttk.Button(btns, text="Cancel", command=self.window.destroy).pack(side="left", padx=6)
@@ -1161,17 +1793,34 @@ class SettingsDialog:
                 self.window.after(0, _apply)
             except Exception as e:
                 self.window.after(0, lambda: messagebox.showerror("Discovery Error", f"Failed to discover vMix inputs:\n{e}"))
-        asyncio.run_coroutine_threadsafe(_task(), asyncio.get_event_loop())
+        self.discoverer.loop.create_task(_task())
 
     def _test_vmix(self):
+        # the main URL plus every connection's vMix, probed side by side
+        api = self.vmix_api_var.get().strip() or "http://localhost:8088/api"
+        urls = list(dict.fromkeys(
+            [api] + [u for u in (c.get("vmix_api_url") for c in self.connections) if u and _URL_RE.match(u)]
+        ))
+
         async def _task():
-            try:
-                api = self.vmix_api_var.get().strip() or "http://localhost:8088/api"
-                inputs, _ = await self.discoverer.discover_vmix_inputs(api)
-                self.window.after(0, lambda: messagebox.showinfo("vMix", f"Connected. Found {len(inputs)} input(s)."))
-            except Exception as e:
-                self.window.after(0, lambda: messagebox.showerror("vMix", f"Connection failed:\n{e}"))
-        asyncio.run_coroutine_threadsafe(_task(), asyncio.get_event_loop())
+            for url in urls:
+                self.discoverer.invalidate(url)
+            results = await self.discoverer.discover_many(urls)
+            if len(urls) == 1:
+                res = results[api]
+                if isinstance(res, BaseException):
+                    self.window.after(0, lambda: messagebox.showerror("vMix", f"Connection failed:\n{res}"))
+                else:
+                    self.window.after(0, lambda: messagebox.showinfo("vMix", f"Connected. Found {len(res[0])} input(s)."))
+                return
+            lines = [
+                f"✗ {url}: {res}" if isinstance(res, BaseException) else f"✓ {url}: {len(res[0])} input(s)"
+                for url, res in results.items()
+            ]
+            failed = all(isinstance(r, BaseException) for r in results.values())
+            show = messagebox.showerror if failed else messagebox.showinfo
+            self.window.after(0, lambda: show("vMix", "\n".join(lines)))
+        self.discoverer.loop.create_task(_task())
 
     # ---- Quick Add + JSON import
     def _connections_summary(self) -> str:
@@ -1193,14 +1842,7 @@ class SettingsDialog:
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict) and "connections" in data:
-                conns = data["connections"]
-            else:
-                conns = data
-            if not isinstance(conns, list):
-                raise ValueError('JSON must be a list of connection objects or {"connections": [...]}')
+            conns = read_connections_json(path)
             self.connections = conns
             self.conn_info_var.set(self._connections_summary())
             messagebox.showinfo("Import JSON", f"Loaded {len(conns)} connection(s). Save settings to persist.")
@@ -1209,30 +1851,38 @@ class SettingsDialog:
 
     # ---- Save settings
     def _save_settings(self):
-        try:
-            new_settings = {
-                "vmix_api_url": (self.vmix_api_var.get().strip() or "http://localhost:8088/api"),
-                "openlp_ws_url": (self.openlp_ws_var.get().strip() or "ws://localhost:4317"),
-                "api_port": max(1024, min(65535, int(self.api_port_var.get().strip() or "5000"))),
-                "vmix_title_input": (self.input_var.get().strip() or "SongTitle"),
-                "vmix_title_field": (self.field_var.get().strip() or "Message.Text"),
-                "splash_enabled": bool(self.splash_var.get()),
-                "poll_interval_sec": max(1, int(self.poll_var.get().strip() or "2")),
-                "overlay_channel": max(1, min(4, int(self.overlay_var.get().strip() or "1"))),
-                "auto_overlay_on_send": bool(self.aoin_var.get()),
-                "auto_overlay_out_on_clear": bool(self.aoout_var.get()),
-                "overlay_always_on": bool(self.always_on_var.get()),
-                "auto_clear_idle_sec": max(0, int(self.idle_var.get().strip() or "0")),
-                "max_chars_per_line": max(10, int(self.wrap_var.get().strip() or "36")),
-                "clear_on_blank": bool(self.cob_var.get()),
-                "text_layer_above": bool(self.text_layer_above_var.get()),
-                # bring in any quick-added / imported connections
-                "connections": list(self.connections),
-                "preach_db_path": self.config.get("settings", {}).get("preach_db_path", "lyrisync_preach.db"),
-            }
-        except ValueError as e:
-            messagebox.showerror("Settings", f"Invalid numeric value:\n{e}")
+        new_settings: Dict[str, Any] = {}
+        errors: List[str] = []
+        for kind, label, var_name, key, default, opts in _SETTINGS_FIELDS:
+            if key is None:
+                continue
+            value = getattr(self, var_name).get()
+            if kind == "check":
+                new_settings[key] = bool(value)
+                continue
+            value = value.strip() or str(default)
+            if "int" in opts:
+                lo, hi = opts["int"]
+                try:
+                    value = int(value)
+                except ValueError:
+                    errors.append(f"{label.rstrip(':')} {value!r} is not a whole number")
+                    continue
+                if lo is not None:
+                    value = max(lo, value)
+                if hi is not None:
+                    value = min(hi, value)
+            elif opts.get("url") and not _URL_RE.match(value):
+                errors.append(f"{label.rstrip(':')} must start with http:// or https://")
+                continue
+            new_settings[key] = value
+        # report every bad field at once rather than stopping at the first
+        if errors:
+            messagebox.showerror("Settings", "Invalid value:\n" + "\n".join(errors))
             return
+        # bring in any quick-added / imported connections
+        new_settings["connections"] = list(self.connections)
+        new_settings["preach_db_path"] = self.config.get("settings", {}).get("preach_db_path", "lyrisync_preach.db")
 
         try:
             self.on_apply(new_settings)
@@ -1,25 +1,48 @@
 # main.py
 import asyncio
+import functools
+import textwrap
 import threading
 import time
-from typing import Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+from urllib.parse import urlsplit
 
 import ttkbootstrap as tb
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+
+try:
+    import orjson  # optional C JSON codec
+    _ORJSON_OK = True
+except ImportError:
+    _ORJSON_OK = False
+
+try:
+    import uvloop  # libuv event loop; not available on Windows
+    _UVLOOP_OK = True
+except ImportError:
+    _UVLOOP_OK = False
+
+try:
+    from waitress import serve as _wsgi_serve  # production WSGI server, bounded thread pool
+    _WAITRESS_OK = True
+except ImportError:
+    _WAITRESS_OK = False
 
 from gui_manager import LyriSyncGUI, load_config, save_config
 from vmix_openlp_handler import VmixController, OpenLPController
 
 # -------------------------
-# Global state & locks
+# Global state
 # -------------------------
+# No lock: every access is a single-key read/write, a dict copy, or a float
+# rebind, each atomic under the GIL, and no two fields must change together.
 state = {
     "lyrics": "",
     "overlay_on": False,
     "recording": False,
 }
 last_lyrics_ts = 0.0
-lock = threading.Lock()
 shutdown_evt = threading.Event()
 
 gui: LyriSyncGUI | None = None
@@ -28,45 +51,169 @@ openlp: OpenLPController | None = None
 settings = {}
 loop: asyncio.AbstractEventLoop | None = None
 
+
+@dataclass(slots=True, frozen=True)
+class SettingsSnapshot:
+    """Parsed, typed view of the settings the hot paths read; rebuilt on apply."""
+    title_input: str = "SongTitle"
+    title_field: str = "Message.Text"
+    overlay_channel: int = 1
+    overlay_always_on: bool = False
+    auto_overlay_on_send: bool = True
+    auto_overlay_out_on_clear: bool = True
+    max_chars_per_line: int = 48
+    auto_clear_idle_sec: int = 0
+    poll_interval_sec: int = 2
+    clear_on_blank: bool = True
+    api_port: int = 5000
+    show_debounce_sec: float = 0.05
+
+    @classmethod
+    def from_settings(cls, s: Dict[str, Any]) -> "SettingsSnapshot":
+        return cls(
+            title_input=s.get("vmix_title_input", "SongTitle"),
+            title_field=s.get("vmix_title_field", "Message.Text"),
+            overlay_channel=int(s.get("overlay_channel", 1)),
+            overlay_always_on=bool(s.get("overlay_always_on", False)),
+            auto_overlay_on_send=bool(s.get("auto_overlay_on_send", True)),
+            auto_overlay_out_on_clear=bool(s.get("auto_overlay_out_on_clear", True)),
+            max_chars_per_line=int(s.get("max_chars_per_line", 48)),
+            auto_clear_idle_sec=int(s.get("auto_clear_idle_sec", 0)),
+            poll_interval_sec=max(1, int(s.get("poll_interval_sec", 2))),
+            clear_on_blank=bool(s.get("clear_on_blank", True)),
+            api_port=int(s.get("api_port", 5000)),
+            show_debounce_sec=max(0, int(s.get("show_debounce_ms", 50))) / 1000,
+        )
+
+
+# swapped as a whole (one atomic rebind) whenever settings are applied
+current = SettingsSnapshot()
+
+
+def apply_settings(new_settings: Dict[str, Any]) -> None:
+    global settings, current
+    snap = SettingsSnapshot.from_settings(new_settings)
+    settings, current = new_settings, snap
+    _rearm_idle_clear()  # auto_clear_idle_sec may have changed
+
 # -------------------------
 # Helpers
 # -------------------------
+_tasks: set = set()  # strong refs: the loop only keeps weak ones to running tasks
+
+
+def _spawn(coro) -> None:
+    task = loop.create_task(coro)
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+def _rearm_idle_clear() -> None:
+    # safe from any thread; no-op before the loop exists
+    if loop is not None:
+        loop.call_soon_threadsafe(_arm_idle_clear)
+
+
+def fire(coro) -> None:
+    """Run coro on the asyncio loop from any thread; fire-and-forget, no result Future."""
+    loop.call_soon_threadsafe(_spawn, coro)
+
+@functools.lru_cache(maxsize=8)
+def _wrapper(max_chars: int) -> textwrap.TextWrapper:
+    # one TextWrapper per width; it compiles its chunking regexes once
+    return textwrap.TextWrapper(width=max(1, max_chars), break_long_words=False, break_on_hyphens=False)
+
+
+OPENLP_DEFAULT_PORT = 4317
+
+
+def normalize_ws_url(raw: str) -> str:
+    """OpenLP URL as ws://host:port, filling in what the user left out ("localhost:4317", "ws://pc")."""
+    raw = (raw or "").strip()
+    u = urlsplit(raw if "://" in raw else f"ws://{raw}")
+    try:
+        port = u.port
+    except ValueError:  # non-numeric / out-of-range port
+        port = None
+    host = u.hostname or "localhost"
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    scheme = u.scheme if u.scheme in ("ws", "wss") else "ws"
+    return f"{scheme}://{host}:{port or OPENLP_DEFAULT_PORT}{u.path}"
+
+
+@functools.lru_cache(maxsize=256)  # pure; OpenLP re-sends the current slide often
 def soft_wrap(text: str, max_chars: int) -> str:
     """
     Wrap to at most two lines. Respects word boundaries where possible.
+    Line 1 is filled greedily; everything left over goes on line 2 (never dropped).
     """
-    text = (text or "").strip()
+    text = " ".join((text or "").split())
     if not text:
         return ""
-    words = text.split()
-    line1, line2 = "", ""
-    for w in words:
-        cand = (line1 + " " + w).strip() if line1 else w
-        if len(cand) <= max_chars or not line1:
-            line1 = cand
-        else:
-            cand2 = (line2 + " " + w).strip() if line2 else w
-            line2 = cand2
-    return line1 if not line2 else f"{line1}\n{line2}"
+    lines = _wrapper(max_chars).wrap(text)
+    return lines[0] if len(lines) == 1 else f"{lines[0]}\n{' '.join(lines[1:])}"
 
-async def update_leds_from_status():
+# (text, max_chars, wrapped) of the last show; only touched on the loop thread
+_last_payload: Tuple[str, int, str] = ("", -1, "")
+
+
+def _show_payload(text: str, max_chars: int) -> str:
+    # single-slot check first: OpenLP re-sending the current slide is the common case
+    global _last_payload
+    last_text, last_chars, wrapped = _last_payload
+    if last_text == text and last_chars == max_chars:
+        return wrapped
+    wrapped = soft_wrap(text, max_chars)
+    _last_payload = (text, max_chars, wrapped)
+    return wrapped
+
+# bumped by _assume_status; a status fetch started before the bump is stale
+_status_gen = 0
+
+
+async def update_leds_from_status() -> Tuple[bool, bool, bool] | None:
+    """
+    Fetch vMix status once and push reachability, recording and overlay together.
+    Returns (vmix_ok, recording, overlay1), or None if an action assumed a newer
+    status while the fetch was in flight (the result is then discarded).
+    """
+    gen = _status_gen
     try:
         s = await vmix.get_status()
-        rec = str(s.get("recording", "")).lower() == "true"
-        ov1 = str(s.get("overlay1", "")).lower() == "true"
-        with lock:
-            state["recording"] = rec
-            state["overlay_on"] = ov1
-        if gui:
-            gui.thread_safe(gui.set_recording, rec)
-            gui.thread_safe(gui.set_overlay, ov1)
     except Exception:
-        # keep LEDs red if status fails
-        pass
+        s = {}
+    if gen != _status_gen:
+        return None
+    # an empty status means vMix did not answer: keep LEDs red
+    vmix_ok = bool(s)
+    rec = s.get("recording", False)
+    ov1 = s.get("overlay1", False)
+    state["recording"] = rec
+    state["overlay_on"] = ov1
+    if gui:
+        # one coalesced Tk callback; unchanged LEDs are skipped
+        gui.apply_state(vmix_ok=vmix_ok, recording=rec, overlay=ov1)
+    return vmix_ok, rec, ov1
 
 # -------------------------
 # Action dispatcher
 # -------------------------
+def _assume_status(recording: bool | None = None, overlay: bool | None = None) -> None:
+    """
+    Record an action's known effect on vMix without a status round-trip (None = unknown).
+    health_watcher confirms it against vMix one poll interval later.
+    """
+    global _status_gen
+    _status_gen += 1
+    if recording is not None:
+        state["recording"] = recording
+    if overlay is not None:
+        state["overlay_on"] = overlay
+    _status_kick.set()
+    if gui:
+        gui.apply_state(recording=recording, overlay=overlay)
+
 async def handle_action(action):
     """
     Supports:
@@ -81,27 +228,29 @@ async def handle_action(action):
     if action is None:
         return
 
-    # Read settings
-    title_input = settings.get("vmix_title_input", "SongTitle")
-    title_field = settings.get("vmix_title_field", "Message.Text")
-    ch = int(settings.get("overlay_channel", 1))
-    always_on = bool(settings.get("overlay_always_on", False))
-    auto_in = bool(settings.get("auto_overlay_on_send", True))
-    auto_out = bool(settings.get("auto_overlay_out_on_clear", True))
-    max_chars = int(settings.get("max_chars_per_line", 48))
+    # Read settings (one snapshot for the whole action)
+    cur = current
+    title_input = cur.title_input
+    title_field = cur.title_field
+    ch = cur.overlay_channel
+    always_on = cur.overlay_always_on
+    auto_in = cur.auto_overlay_on_send
+    auto_out = cur.auto_overlay_out_on_clear
+    max_chars = cur.max_chars_per_line
+    # state["overlay_on"] mirrors overlay 1 only
+    tracks_overlay = ch == 1
 
     # Set/Send/Clear
     if isinstance(action, tuple) and action[0] == "set_lyrics_text":
         text = (action[1] or "").strip().upper()
-        with lock:
-            state["lyrics"] = text
-            last_lyrics_ts = time.time()
+        state["lyrics"] = text
+        last_lyrics_ts = time.time()
+        _arm_idle_clear()
         return
 
     if action == "show_lyrics":
-        with lock:
-            text = state["lyrics"]
-        wrapped = soft_wrap(text, max_chars)
+        text = state["lyrics"]
+        wrapped = _show_payload(text, max_chars)
         await vmix.send_title_text(title_input, title_field, wrapped)
         if always_on:
             # force on
@@ -114,113 +263,186 @@ async def handle_action(action):
                 await vmix.trigger_overlay(ch, "In")
             except Exception:
                 pass
-        await update_leds_from_status()
+        _assume_status(overlay=True if tracks_overlay and (always_on or auto_in) else None)
         return
 
     if action == "clear_lyrics":
         await vmix.send_title_text(title_input, title_field, "")
-        if not always_on and auto_out:
+        overlay_out = not always_on and auto_out
+        if overlay_out:
             try:
                 await vmix.trigger_overlay(ch, "Out")
             except Exception:
                 pass
-        await update_leds_from_status()
+        _assume_status(overlay=False if tracks_overlay and overlay_out else None)
         return
 
     if action == "toggle_overlay":
         await vmix.trigger_overlay(ch, "In")  # vMix treats repeated In/Out as toggle for title overlays
-        await update_leds_from_status()
+        _assume_status(overlay=not state["overlay_on"] if tracks_overlay else None)
         return
 
     if action == "start_recording":
         await vmix.start_recording()
-        await update_leds_from_status()
+        _assume_status(recording=True)
         return
 
     if action == "stop_recording":
         await vmix.stop_recording()
-        await update_leds_from_status()
+        _assume_status(recording=False)
         return
 
 # -------------------------
 # Idle auto-clear & health
 # -------------------------
-async def idle_watcher():
-    global last_lyrics_ts
-    while not shutdown_evt.is_set():
-        try:
-            idle = int(settings.get("auto_clear_idle_sec", 0))
-            if idle > 0:
-                with lock:
-                    ts = last_lyrics_ts
-                if ts and (time.time() - ts) >= idle:
-                    await handle_action("clear_lyrics")
-                    with lock:
-                        last_lyrics_ts = 0.0
-        except Exception:
-            pass
-        await asyncio.sleep(1)
+# one pending auto-clear, re-armed on new lyrics / settings changes; loop thread only
+_clear_handle: asyncio.TimerHandle | None = None
+
+
+def _arm_idle_clear() -> None:
+    global _clear_handle
+    if _clear_handle is not None:
+        _clear_handle.cancel()
+        _clear_handle = None
+    idle = current.auto_clear_idle_sec
+    ts = last_lyrics_ts
+    if idle > 0 and ts:
+        _clear_handle = loop.call_later(max(0.0, idle - (time.time() - ts)), _auto_clear)
+
+
+def _auto_clear() -> None:
+    global _clear_handle, last_lyrics_ts
+    _clear_handle = None
+    ts = last_lyrics_ts
+    if not ts or time.time() - ts < current.auto_clear_idle_sec:
+        # lyrics arrived after the timer was armed (their re-arm may still be queued)
+        _arm_idle_clear()
+        return
+    # not dead: submit_lyrics stamps last_lyrics_ts from the OpenLP/API threads,
+    # and the GIL can switch to one of them between the read above and here.
+    # Zeroing that newer stamp would leave its queued re-arm with nothing to arm.
+    if last_lyrics_ts == ts:
+        last_lyrics_ts = 0.0
+    _spawn(handle_action("clear_lyrics"))
+
+# upper bound for the backed-off poll; also bounds how late a vMix outage shows up
+HEALTH_MAX_INTERVAL_SEC = 10
+# set by actions that assumed their effect; health_watcher then confirms it promptly
+_status_kick = asyncio.Event()
+
 
 async def health_watcher():
+    last = None
+    delay = current.poll_interval_sec
     while not shutdown_evt.is_set():
-        await update_leds_from_status()
-        await asyncio.sleep(max(1, int(settings.get("poll_interval_sec", 2))))
+        interval = current.poll_interval_sec
+        # clear before fetching: a kick from an action during the fetch must survive it
+        _status_kick.clear()
+        status = await update_leds_from_status()
+        # nothing changed: poll less often; any change snaps back to the configured interval
+        if status == last:
+            delay = min(max(interval, HEALTH_MAX_INTERVAL_SEC), delay * 2)
+        else:
+            delay = interval
+        last = status
+        try:
+            await asyncio.wait_for(_status_kick.wait(), delay)
+            # an action assumed its effect: check it against vMix one base interval later
+            delay = interval
+            await asyncio.sleep(interval)
+        except asyncio.TimeoutError:
+            pass
 
 # -------------------------
 # OpenLP wiring
 # -------------------------
+# slide changes closer together than current.show_debounce_sec collapse into one
+# vMix update (latest wins)
+_pending_show: asyncio.TimerHandle | None = None  # only touched on the loop thread
+
+
+def _schedule_slide_action(action: str) -> None:
+    global _pending_show
+    if _pending_show is not None:
+        _pending_show.cancel()
+    _pending_show = loop.call_later(current.show_debounce_sec, _run_slide_action, action)
+
+
+def _run_slide_action(action: str) -> None:
+    global _pending_show
+    _pending_show = None
+    _spawn(handle_action(action))
+
+def submit_lyrics(text: str, action: str = "show_lyrics") -> None:
+    """
+    Single entry point for incoming lyrics (OpenLP thread, HTTP API); any thread.
+    Stores the text, re-arms the idle timer and drives vMix through the debounce window.
+    """
+    global last_lyrics_ts
+    text = (text or "").strip().upper()
+    state["lyrics"] = text
+    # timestamp only when not blank
+    if text:
+        last_lyrics_ts = time.time()
+        _rearm_idle_clear()
+    # show reads state["lyrics"] when it fires, so a burst sends only the latest text
+    loop.call_soon_threadsafe(_schedule_slide_action, action)
+
 def on_openlp_new(payload: Tuple[str, bool]):
     # payload = (text, is_blank)
     text, is_blank = payload
-    text = (text or "").strip().upper()
-    with lock:
-        state["lyrics"] = text
-        # timestamp only when not blank
-        if text:
-            global last_lyrics_ts
-            last_lyrics_ts = time.time()
-
-    # Drive vMix based on blank/text
-    if is_blank and settings.get("clear_on_blank", True):
-        asyncio.run_coroutine_threadsafe(handle_action("clear_lyrics"), loop)
-    else:
-        asyncio.run_coroutine_threadsafe(handle_action("show_lyrics"), loop)
+    action = "clear_lyrics" if is_blank and current.clear_on_blank else "show_lyrics"
+    submit_lyrics(text, action)
 
 def on_openlp_connect():
     if gui:
-        gui.thread_safe(gui.set_conn_status, None, True)
+        gui.set_conn_status(openlp_ok=True)
 
 def on_openlp_disconnect():
     if gui:
-        gui.thread_safe(gui.set_conn_status, None, False)
+        gui.set_conn_status(openlp_ok=False)
 
 # -------------------------
 # Flask mini API (optional)
 # -------------------------
 api = Flask(__name__)
+API_THREADS = 8
+_OK_BODY = b'{"ok":true}\n'
+
+
+def _ok() -> Response:
+    # pre-encoded body: skips jsonify's per-request serialization
+    return Response(_OK_BODY, mimetype="application/json")
+
+
+def _json_response(obj: Any) -> Response:
+    if _ORJSON_OK:
+        return Response(orjson.dumps(obj), mimetype="application/json")
+    return jsonify(obj)
 
 @api.route("/api/show_lyrics", methods=["POST"])
 def api_show_lyrics():
-    data = request.json or {}
-    txt = str(data.get("text", "")).upper()
-    with lock:
-        state["lyrics"] = txt
-    asyncio.run_coroutine_threadsafe(handle_action("show_lyrics"), loop)
-    return jsonify(ok=True)
+    data = request.get_json(silent=True) or {}
+    submit_lyrics(str(data.get("text", "")))
+    return _ok()
 
 @api.route("/api/clear_lyrics", methods=["POST"])
 def api_clear_lyrics():
-    asyncio.run_coroutine_threadsafe(handle_action("clear_lyrics"), loop)
-    return jsonify(ok=True)
+    # same window as OpenLP, so API and slide updates keep their order
+    loop.call_soon_threadsafe(_schedule_slide_action, "clear_lyrics")
+    return _ok()
 
 @api.route("/api/status")
 def api_status():
-    with lock:
-        return jsonify(state)
+    snapshot = state.copy()  # one C-level copy: consistent without a lock
+    return _json_response(snapshot)
 
 def run_api():
-    port = int(settings.get("api_port", 5000))
-    api.run(port=port, threaded=True)
+    port = current.api_port
+    if _WAITRESS_OK:
+        _wsgi_serve(api, host="127.0.0.1", port=port, threads=API_THREADS)
+    else:
+        api.run(port=port, threaded=True)
 
 # -------------------------
 # Main
@@ -228,15 +450,17 @@ def run_api():
 if __name__ == "__main__":
     # Load configuration
     config = load_config()
-    settings = config.get("settings", {}) or {}
+    apply_settings(config.get("settings", {}) or {})
 
     # Controllers
     vmix = VmixController(api_url=settings.get("vmix_api_url", "http://localhost:8088/api"))
-    openlp = OpenLPController(ws_url=settings.get("openlp_ws_url", "ws://localhost:4317"))
+    openlp = OpenLPController(ws_url=normalize_ws_url(settings.get("openlp_ws_url", "")))
 
-    # Async loop
-    loop = asyncio.new_event_loop()
+    # Async loop (vMix I/O, watchers) on its own thread; Tk owns the main thread
+    loop = uvloop.new_event_loop() if _UVLOOP_OK else asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
 
     # OpenLP callbacks
     openlp.on_new_lyrics = on_openlp_new
@@ -250,24 +474,34 @@ if __name__ == "__main__":
         root,
         config,
         save_config,
-        action_callback=lambda a: asyncio.run_coroutine_threadsafe(handle_action(a), loop),
+        action_callback=lambda a: fire(handle_action(a)),
+        on_settings_applied=apply_settings,
     )
 
     # Kick off background tasks
-    asyncio.run_coroutine_threadsafe(health_watcher(), loop)
-    asyncio.run_coroutine_threadsafe(idle_watcher(), loop)
+    fire(health_watcher())
 
     # Optional: start API server
     threading.Thread(target=run_api, daemon=True).start()
 
     def on_close():
         shutdown_evt.set()
+        try:
+            gui.shutdown()
+        except Exception:
+            pass
         try:
             openlp.stop()
         except Exception:
             pass
+        try:
+            # release vMix keep-alive connections before the loop goes away
+            asyncio.run_coroutine_threadsafe(vmix.close(), loop).result(timeout=1.0)
+        except Exception:
+            pass
         try:
             loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join(timeout=2.0)
         except Exception:
             pass
         root.destroy()
@@ -1,14 +1,44 @@
 # vmix_openlp_handler.py
 import asyncio
 import json
-import time
+import random
+import re
 import threading
 from typing import Callable, Optional, Tuple, Dict, Any, List
 
 import aiohttp
 import websockets
+from yarl import URL
 from websockets.exceptions import ConnectionClosed, InvalidURI
-import xml.etree.ElementTree as ET
+
+try:
+    import orjson  # optional C JSON codec
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# keep-alive pool for the vMix API; sized well above the calls one action makes
+HTTP_POOL_LIMIT = 64
+HTTP_POOL_LIMIT_PER_HOST = 8
+KEEPALIVE_SEC = 30  # idle sockets outlive the poll interval, so polls reuse them
+DNS_CACHE_TTL_SEC = 300
+
+# get_status only needs these few scalar elements out of the (often large) API
+# document, so scan the raw bytes for them instead of building an element tree
+_STATUS_TAGS = ("recording", "overlay1", "overlay2", "overlay3", "overlay4")
+_STATUS_RE = re.compile(rb"<(recording|overlay[1-4])\b[^>/]*>([^<]*)<")
+_OVERLAY_ACTIONS = frozenset({"In", "Out", "On", "Off"})
+
+# OpenLP reconnect: quick first retry, doubling to the cap, +/-25% jitter
+WS_BACKOFF_START_SEC = 0.5
+WS_BACKOFF_MAX_SEC = 15.0
+WS_BACKOFF_JITTER = 0.25
+
+# exact blank/clear frames, answered without running the JSON parser
+_BLANK_FRAMES = frozenset(
+    f for body in ('{"type":"blank"}', '{"type":"clear"}', '{"action":"blank"}', '{"action":"clear"}')
+    for f in (body, body.encode())
+)
 
 
 # ---------------------
@@ -18,59 +48,76 @@ class VmixController:
     """
     Async vMix controller using HTTP API (http://host:8088/api).
     Methods:
-      - send_title_text(input_name, field, text)
+      - send_title_text(input_name, field, text)   # skipped if unchanged since last send
       - trigger_overlay(overlay_number, action)   # action in {"In","Out","On","Off"}
       - start_recording(), stop_recording()
-      - get_status() -> dict
+      - get_status() -> dict   # {"recording"/"overlay1".."overlay4": bool}, {} if unreachable;
+                               # concurrent callers share one request
       - close()
+    Pass `session` to share one ClientSession (and its connection pool) between
+    controllers; an injected session is left for its owner to close.
     """
 
-    def __init__(self, api_url: str = "http://localhost:8088/api", timeout_sec: float = 4.0):
+    __slots__ = ("api_url", "_session", "_owns_session", "_timeout", "_status_fut", "_last_text",
+                 "_function_urls")
+
+    def __init__(self, api_url: str = "http://localhost:8088/api", timeout_sec: float = 4.0,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.api_url = api_url.rstrip("/")
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self._timeout = aiohttp.ClientTimeout(total=timeout_sec)
+        # in-flight status fetch, shared by concurrent get_status callers
+        self._status_fut: Optional[asyncio.Future] = None
+        # (input, field) -> text vMix last acknowledged; cleared when vMix stops answering
+        self._last_text: Dict[Tuple[str, str], str] = {}
+        # Function name -> prebuilt request URL for the fixed, parameterless commands
+        self._function_urls: Dict[str, URL] = {}
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
+            connector = aiohttp.TCPConnector(limit=HTTP_POOL_LIMIT, limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                                             keepalive_timeout=KEEPALIVE_SEC, ttl_dns_cache=DNS_CACHE_TTL_SEC)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+            self._owns_session = True
         return self._session
 
-    async def _get_xml(self) -> Optional[ET.Element]:
+    async def _get_api_body(self) -> Optional[bytes]:
         try:
             session = await self._get_session()
             async with session.get(self.api_url) as res:
                 if res.status != 200:
                     return None
-                text = await res.text()
-                try:
-                    return ET.fromstring(text)
-                except ET.ParseError:
-                    return None
+                return await res.read()
         except Exception:
             return None
 
     async def send_title_text(self, input_name: str, field: str, text: str) -> None:
+        key, text = (input_name, field), text or ""
+        if self._last_text.get(key) == text:
+            return  # OpenLP re-sent the slide vMix is already showing
+        self._invalidate_status()
         try:
             session = await self._get_session()
             params = {"Function": "SetText",
                       "Input": input_name,
                       "SelectedName": field,
-                      "Value": text or ""}
-            async with session.get(self.api_url, params=params) as _:
-                pass
+                      "Value": text}
+            async with session.get(self.api_url, params=params) as res:
+                if res.status == 200:
+                    self._last_text[key] = text
+                else:
+                    self._last_text.pop(key, None)
         except Exception:
-            pass
+            self._last_text.pop(key, None)
 
     async def trigger_overlay(self, overlay_number: int = 1, action: str = "In") -> None:
         try:
             n = max(1, min(4, int(overlay_number)))
-            action = action if action in {"In", "Out", "On", "Off"} else "In"
-            session = await self._get_session()
-            params = {"Function": f"OverlayInput{n}{action}"}
-            async with session.get(self.api_url, params=params) as _:
-                pass
-        except Exception:
-            pass
+        except (TypeError, ValueError):
+            n = 1
+        action = action if action in _OVERLAY_ACTIONS else "In"
+        await self._simple_function(f"OverlayInput{n}{action}")
 
     async def start_recording(self) -> None:
         await self._simple_function("StartRecording")
@@ -78,28 +125,48 @@ class VmixController:
     async def stop_recording(self) -> None:
         await self._simple_function("StopRecording")
 
+    def _function_url(self, func_name: str) -> URL:
+        url = self._function_urls.get(func_name)
+        if url is None:
+            # built and encoded once; later calls skip params encoding and URL parsing
+            url = self._function_urls[func_name] = URL(self.api_url).update_query(Function=func_name)
+        return url
+
     async def _simple_function(self, func_name: str) -> None:
+        self._invalidate_status()
         try:
             session = await self._get_session()
-            async with session.get(self.api_url, params={"Function": func_name}) as _:
+            async with session.get(self._function_url(func_name)) as _:
                 pass
         except Exception:
             pass
 
-    async def get_status(self) -> Dict[str, Any]:
-        root = await self._get_xml()
-        if not root:
+    def _invalidate_status(self) -> None:
+        # state is about to change: later get_status callers must not join an older fetch
+        self._status_fut = None
+
+    async def get_status(self) -> Dict[str, bool]:
+        """Current vMix status. Joins a fetch already in flight instead of issuing another."""
+        fut = self._status_fut
+        if fut is None or fut.done():
+            fut = self._status_fut = asyncio.ensure_future(self._fetch_status())
+        # shield: one caller being cancelled must not cancel the shared fetch
+        return await asyncio.shield(fut)
+
+    async def _fetch_status(self) -> Dict[str, bool]:
+        body = await self._get_api_body()
+        if not body or b"<vmix" not in body[:256]:
+            # vMix may have restarted: don't trust what we think it is showing
+            self._last_text.clear()
             return {}
-        return {
-            "recording": (root.findtext("recording") or "").strip(),
-            "overlay1": (root.findtext("overlay1") or "").strip(),
-            "overlay2": (root.findtext("overlay2") or "").strip(),
-            "overlay3": (root.findtext("overlay3") or "").strip(),
-            "overlay4": (root.findtext("overlay4") or "").strip(),
-        }
+        found: Dict[str, bytes] = {}
+        for tag, value in _STATUS_RE.findall(body):
+            found.setdefault(tag.decode(), value)  # first occurrence wins
+        # vMix always writes "True"/"False"
+        return {tag: found.get(tag, b"").strip() == b"True" for tag in _STATUS_TAGS}
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
+        if self._owns_session and self._session and not self._session.closed:
             await self._session.close()
         self._session = None
 
@@ -112,9 +179,12 @@ class OpenLPController:
     Lightweight OpenLP WebSocket client.
     - Connects to ws://host:4317
     - Emits callbacks on connect/disconnect/new_lyrics
-    - Reconnects with incremental backoff
+    - Reconnects with jittered exponential backoff
     """
 
+    __slots__ = ("ws_url", "last_slide", "running", "on_new_lyrics", "on_connect", "on_disconnect",
+                 "_loop", "_thread")
+
     def __init__(self, ws_url: str = "ws://localhost:4317"):
         self.ws_url = ws_url
         self.last_slide: str = ""
@@ -157,8 +227,7 @@ class OpenLPController:
                 pass
 
     async def _listen_ws(self) -> None:
-        backoff = 2  # seconds
-        max_backoff = 15
+        backoff = WS_BACKOFF_START_SEC
         while self.running:
             try:
                 async with websockets.connect(self.ws_url, ping_interval=20, ping_timeout=20) as ws:
@@ -167,16 +236,18 @@ class OpenLPController:
                             self.on_connect()
                         except Exception:
                             pass
-                    backoff = 2  # reset after good connect
+                    backoff = WS_BACKOFF_START_SEC  # reset after good connect
 
+                    # bound once per connection: the loop below runs per frame
+                    recv, process = ws.recv, self._process_message
                     while self.running:
                         try:
-                            msg = await ws.recv()
+                            msg = await recv()
                         except ConnectionClosed:
                             break
                         except Exception:
                             break
-                        await self._process_message(msg)
+                        await process(msg)
 
             except InvalidURI:
                 await asyncio.sleep(5)
@@ -190,15 +261,21 @@ class OpenLPController:
                     pass
 
             if self.running:
-                await asyncio.sleep(backoff)
-                backoff = min(max_backoff, backoff * 2)
+                # jitter keeps several clients of one OpenLP from reconnecting in lockstep
+                await asyncio.sleep(backoff * random.uniform(1 - WS_BACKOFF_JITTER, 1 + WS_BACKOFF_JITTER))
+                backoff = min(WS_BACKOFF_MAX_SEC, backoff * 2)
 
     async def _process_message(self, message: Any) -> None:
         text = ""
         is_blank = False
 
+        if isinstance(message, (str, bytes)) and message in _BLANK_FRAMES:
+            self._emit_lyrics("", True)
+            return
+
         try:
-            data = json.loads(message) if isinstance(message, str) else {}
+            # orjson takes str and bytes frames alike without a decode step
+            data = _json_loads(message) if isinstance(message, (str, bytes)) else {}
         except Exception:
             data = {}
 
@@ -211,6 +288,9 @@ class OpenLPController:
             if typ in {"blank", "clear"} or act in {"blank", "clear"}:
                 is_blank = True
 
+        self._emit_lyrics(text, is_blank)
+
+    def _emit_lyrics(self, text: str, is_blank: bool) -> None:
         self.last_slide = text
         cb = self.on_new_lyrics
         if callable(cb):